@@ -7,6 +7,11 @@ import sys
 import subprocess
 from pathlib import Path
 
+# Directorio de trabajo y estructura del proyecto, comprobados una sola vez
+_CWD = Path.cwd()
+_HAS_CLI = Path("cli").is_dir()
+_HAS_CORE = Path("custom_components/neural/core").is_dir()
+
 # Colores para output
 class Colors:
     HEADER = '\033[95m'
@@ -44,7 +49,7 @@ def print_info(text):
 def run_command(cmd):
     """Ejecutar comando y retornar resultado."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path.cwd())
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=_CWD)
         return {
             'success': result.returncode == 0,
             'stdout': result.stdout,
@@ -151,7 +156,7 @@ def main():
     print_header("Neural - Coverage Checker")
     
     # Verificar que estamos en el directorio correcto
-    if not Path("cli").exists() or not Path("core").exists():
+    if not _HAS_CLI or not _HAS_CORE:
         print_error("This script must be run from the project root directory")
         sys.exit(1)
     
@@ -8,6 +8,7 @@ from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, PLATFORMS
 from .coordinator import NeuralDataUpdateCoordinator
+from .core.utils.md_utils import preload_templates
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +23,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Load coordinator data
     await coordinator.async_config_entry_first_refresh()
 
+    # Load the prompt templates once, off the event loop
+    await hass.async_add_executor_job(preload_templates, True)
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     hass.data[DOMAIN]["coordinator"] = coordinator  # Store coordinator for intents
@@ -29,11 +33,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Set up all platforms for this entry
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Set up services (only once)
-    if not hass.data[DOMAIN].get("services_setup"):
-        from .services import async_setup_services
-        await async_setup_services(hass)
-        hass.data[DOMAIN]["services_setup"] = True
+    # Set up services bound to this entry's coordinator; registering again
+    # on a reload replaces the handlers bound to the previous one
+    from .services import async_setup_services
+    await async_setup_services(hass, coordinator)
 
     # Set up intents (only once)
     if not hass.data[DOMAIN].get("intents_setup"):
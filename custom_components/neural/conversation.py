@@ -6,6 +6,7 @@ import logging
 
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.components.conversation import (
     ConversationEntity,
@@ -69,7 +70,7 @@ class NeuralConversationAgent(
             _LOGGER.warning("Using work mode: %s", work_mode)
  
             # Setup dependencies and get use cases
-            await setup_dependencies()
+            await setup_dependencies(session=async_get_clientsession(self.hass))
             decision_use_case = get_decision_use_case()
             do_actions_use_case = get_do_actions_use_case()
             
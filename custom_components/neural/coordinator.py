@@ -8,6 +8,7 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .core.dependency_injection.providers import setup_dependencies, clear_dependencies
@@ -66,7 +67,7 @@ class NeuralDataUpdateCoordinator(DataUpdateCoordinator):
             await self.async_request_refresh()
             
             # Setup dependencies using config.json
-            await setup_dependencies()
+            await setup_dependencies(session=async_get_clientsession(self.hass))
             
             # Get use cases
             decision_use_case = get_decision_use_case()
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import wave
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from io import BytesIO
 
 import aiohttp
@@ -11,6 +11,7 @@ import openai
 
 from ..const import SUPPORTED_LANGUAGES
 from .base_client import BaseClient
+from ..utils.text_utils import truncate
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,9 +19,19 @@ _LOGGER = logging.getLogger(__name__)
 class AIClient(BaseClient):
     """AI client for OpenRouter integration."""
 
-    def __init__(self, ai_url: str, ai_model: str, api_key: str, stt_model: str, stt_api_key: str) -> None:
-        """Initialize the AI client."""
+    def __init__(
+        self,
+        ai_url: str,
+        ai_model: str,
+        api_key: str,
+        stt_model: str,
+        stt_api_key: str,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """Initialize the AI client, optionally sharing an externally owned session."""
         super().__init__()
+        self._session = session
+        self._owns_session = session is None
         self._ai_url = ai_url
         self._ai_model = ai_model
         self._api_key = api_key
@@ -123,7 +134,7 @@ class AIClient(BaseClient):
                 "presence_penalty": 0.0
             }
             
-            _LOGGER.debug("Sending prompt to OpenRouter model %s: %s", model_to_use, message[:100] + "..." if len(message) > 100 else message)
+            _LOGGER.debug("Sending prompt to OpenRouter model %s: %s", model_to_use, truncate(message, 100))
             
             async with self._session.post(
                 f"{self._ai_url}/chat/completions",
@@ -136,7 +147,7 @@ class AIClient(BaseClient):
                     choices = result.get("choices", [])
                     if choices and len(choices) > 0:
                         response_text = choices[0].get("message", {}).get("content", "")
-                        _LOGGER.debug("OpenRouter response received: %s", response_text[:100] + "..." if len(response_text) > 100 else response_text)
+                        _LOGGER.debug("OpenRouter response received: %s", truncate(response_text, 100))
                         return response_text
                     else:
                         _LOGGER.error("No response choices in OpenRouter result")
@@ -287,7 +298,7 @@ class AIClient(BaseClient):
 
     async def disconnect(self) -> None:
         """Disconnect from the OpenRouter service."""
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
             self._session = None
         if self._whisper_client:
@@ -297,44 +308,45 @@ class AIClient(BaseClient):
     # Whisper methods
     async def transcribe_audio(self, audio_data: bytes, language: str = "es") -> str:
         """Transcribe audio using OpenAI Whisper."""
+        async def _single_chunk() -> AsyncIterator[bytes]:
+            yield audio_data
+
+        return await self.transcribe_audio_stream(_single_chunk(), language)
+
+    async def transcribe_audio_stream(self, chunks: AsyncIterator[bytes], language: str = "es") -> str:
+        """Transcribe a stream of raw PCM chunks using OpenAI Whisper."""
         try:
             if not self._whisper_client:
                 if not self._stt_api_key:
                     raise ValueError("STT API key is required for audio transcription")
                 # Initialize client in executor to avoid blocking
-                import asyncio
                 self._whisper_client = await asyncio.get_event_loop().run_in_executor(
                     None, lambda: openai.OpenAI(api_key=self._stt_api_key)
                 )
             
             _LOGGER.info("Transcribing audio with Whisper model: %s, language: %s", self.stt_model, language)
             
-            # Ensure audio data is valid
-            if len(audio_data) < 1000:  # Minimum size check
-                raise ValueError("Audio data too small, might be corrupted")
-            
-            # Log audio data details for debugging
-            _LOGGER.info("Audio data size: %d bytes, first 20 bytes: %s", len(audio_data), audio_data[:20].hex())
-            
-            # Create proper WAV file using Python's wave module
-            wav_buffer = BytesIO()
-            
-            # Create WAV file with proper header
-            with wave.open(wav_buffer, 'wb') as wav_file:
+            # Write chunks straight into the WAV container so the raw audio is never held twice
+            audio_file = BytesIO()
+            audio_size = 0
+            with wave.open(audio_file, 'wb') as wav_file:
                 wav_file.setnchannels(1)  # Mono
                 wav_file.setsampwidth(2)  # 16-bit
                 wav_file.setframerate(16000)  # 16kHz
-                wav_file.writeframes(audio_data)
+                async for chunk in chunks:
+                    wav_file.writeframes(chunk)
+                    audio_size += len(chunk)
+            
+            # Ensure audio data is valid
+            if audio_size < 1000:  # Minimum size check
+                raise ValueError("Audio data too small, might be corrupted")
             
-            # Get the complete WAV data
-            wav_data = wav_buffer.getvalue()
-            audio_file = BytesIO(wav_data)
+            audio_file.seek(0)
             audio_file.name = "audio.wav"
             
-            _LOGGER.info("Created WAV file: %d bytes (original: %d bytes)", len(wav_data), len(audio_data))
+            _LOGGER.info("Created WAV file: %d bytes (original: %d bytes)", audio_file.getbuffer().nbytes, audio_size)
             
             # Transcribe using OpenAI Whisper in executor
-            import asyncio
             transcription = await asyncio.get_event_loop().run_in_executor(
                 None,
                 lambda: self._whisper_client.audio.transcriptions.create(
@@ -346,7 +358,7 @@ class AIClient(BaseClient):
             )
             
             result_text = transcription.text
-            _LOGGER.info("Whisper transcription successful: %s", result_text[:50] + "..." if len(result_text) > 50 else result_text)
+            _LOGGER.info("Whisper transcription successful: %s", truncate(result_text))
             
             return result_text
             
@@ -10,6 +10,7 @@ from .ha_entity import (
     HAEntityState,
     HAEntitySummary,
     HAConfig,
+    EntitySnapshot,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "HAEntityState",
     "HAEntitySummary",
     "HAConfig",
+    "EntitySnapshot",
 ]
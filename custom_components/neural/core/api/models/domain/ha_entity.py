@@ -1,7 +1,7 @@
 """Home Assistant domain models."""
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 from datetime import datetime
 
 
@@ -231,3 +231,11 @@ class HAConfig:
             allowlist_external_urls=data.get("allowlist_external_urls", []),
             version_info=data.get("version_info", {}),
         )
+
+
+@dataclass
+class EntitySnapshot:
+    """Point-in-time view of Home Assistant entity ids and services."""
+    entity_ids: FrozenSet[str]
+    services: Dict[str, Dict[str, Any]]
+    fetched_at: float
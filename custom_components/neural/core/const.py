@@ -57,6 +57,7 @@ DEFAULT_AI_URL = "https://openrouter.ai/api/v1"
 DEFAULT_MICROPHONE_ENABLED = True
 DEFAULT_VOICE_LANGUAGE = "es-ES"
 DEFAULT_VOICE_TIMEOUT = 5
+STT_TIMEOUT = 8.0  # seconds allowed for the backend once the audio has ended
 DEFAULT_HA_URL = "http://homeassistant.local:8123"  # Home Assistant default
 DEFAULT_SCAN_INTERVAL = 10  # minutes
 DEFAULT_CONFIG_FILE_PATH = "config.json"
@@ -2,6 +2,8 @@
 
 import logging
 from typing import Type, TypeVar, Optional
+
+import aiohttp
 from injector import Injector, singleton, provider, Module
 
 from ..api.ai_client import AIClient
@@ -53,7 +55,8 @@ class Configuration:
                  ha_url: str = DEFAULT_HA_URL,
                  ha_token: str = "",
                  file_base_path: str = ".",
-                 config_file_path: str = DEFAULT_CONFIG_FILE_PATH):
+                 config_file_path: str = DEFAULT_CONFIG_FILE_PATH,
+                 session: Optional[aiohttp.ClientSession] = None):
         """Initialize configuration."""
         self.ai_url = ai_url
         self.ai_model = ai_model
@@ -64,6 +67,7 @@ class Configuration:
         self.ha_token = ha_token
         self.file_base_path = file_base_path
         self.config_file_path = config_file_path
+        self.session = session
 
 
 class DependencyModule(Module):
@@ -85,7 +89,8 @@ class DependencyModule(Module):
             ai_model=self.config.ai_model,
             api_key=self.config.ai_api_key,
             stt_model=self.config.stt_model,
-            stt_api_key=self.config.stt_api_key
+            stt_api_key=self.config.stt_api_key,
+            session=self.config.session
         )
     
     @provider
@@ -162,10 +167,10 @@ class DependencyModule(Module):
     
     @provider
     @singleton
-    def provide_do_actions_use_case(self, ha_repository: HARepository) -> DoActionsUseCase:
+    def provide_do_actions_use_case(self, ha_repository: HARepository, ha_use_case: HAUseCase) -> DoActionsUseCase:
         """Provide Do Actions use case as singleton."""
         _LOGGER.debug("Creating Do Actions use case")
-        return DoActionsUseCaseImpl(ha_repository)
+        return DoActionsUseCaseImpl(ha_repository, ha_use_case)
     
     @provider
     @singleton
@@ -2,6 +2,9 @@
 
 import logging
 import os
+from typing import Optional
+
+import aiohttp
 
 from .injector_container import (
     initialize_container, 
@@ -36,8 +39,13 @@ from ..const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-async def setup_dependencies() -> None:
-    """Set up all dependencies for the Neural AI integration using injector."""
+async def setup_dependencies(session: Optional[aiohttp.ClientSession] = None) -> None:
+    """
+    Set up all dependencies for the Neural AI integration using injector.
+    
+    Args:
+        session: Shared HTTP session for the AI client; it creates its own if omitted
+    """
     _LOGGER.info("Setting up Neural AI dependencies with injector")
 
     try:
@@ -82,7 +90,8 @@ async def setup_dependencies() -> None:
             stt_model=config_data.stt.model,
             stt_api_key=config_data.stt.api_key,
             ha_url=config_data.ha.url,
-            ha_token=ha_token
+            ha_token=ha_token,
+            session=session
         )
 
         # Initialize the container with configuration
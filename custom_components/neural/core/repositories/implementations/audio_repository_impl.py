@@ -1,10 +1,12 @@
 """Audio repository implementation using AI client."""
 
+import asyncio
 import logging
-from typing import List
+from typing import AsyncIterator, List
 
 from ...api.ai_client import AIClient
 from ...repositories.interfaces.audio_repository import AudioRepository
+from ...utils.text_utils import truncate
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,13 +26,46 @@ class AudioRepositoryImpl(AudioRepository):
             # Use AI client's Whisper functionality
             transcription = await self._ai_client.transcribe_audio(audio_data, language)
             
-            _LOGGER.info("Audio transcription successful: %s", transcription[:50] + "..." if len(transcription) > 50 else transcription)
+            _LOGGER.info("Audio transcription successful: %s", truncate(transcription))
             return transcription
             
         except Exception as e:
             _LOGGER.error("Error transcribing audio: %s", e)
             return ""
 
+    async def transcribe_audio_batch(self, audio_batch: List[bytes], language: str = "es") -> List[str]:
+        """Transcribe several audio clips concurrently using AI client."""
+        _LOGGER.info("Transcribing batch of %d audio clips with language: %s", len(audio_batch), language)
+
+        # The Whisper API takes one file per request, so dispatch the whole batch at once
+        results = await asyncio.gather(
+            *(self._ai_client.transcribe_audio(audio_data, language) for audio_data in audio_batch),
+            return_exceptions=True,
+        )
+
+        transcriptions = []
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error transcribing audio %d of batch: %s", index, result)
+                transcriptions.append("")
+            else:
+                transcriptions.append(result)
+        return transcriptions
+
+    async def transcribe_audio_stream(self, chunks: AsyncIterator[bytes], language: str = "es") -> str:
+        """Transcribe streamed audio chunks using AI client."""
+        try:
+            _LOGGER.info("Transcribing audio stream with language: %s", language)
+
+            transcription = await self._ai_client.transcribe_audio_stream(chunks, language)
+
+            _LOGGER.info("Audio stream transcription successful: %s", truncate(transcription))
+            return transcription
+
+        except Exception as e:
+            _LOGGER.error("Error transcribing audio stream: %s", e)
+            return ""
+
     async def is_audio_supported(self) -> bool:
         """Check if audio processing is supported."""
         try:
@@ -1,7 +1,7 @@
 """Audio repository interface."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
 
 class AudioRepository(ABC):
@@ -12,6 +12,16 @@ class AudioRepository(ABC):
         """Transcribe audio to text using AI service."""
         pass
 
+    @abstractmethod
+    async def transcribe_audio_batch(self, audio_batch: List[bytes], language: str = "es") -> List[str]:
+        """Transcribe several audio clips in one call, preserving input order."""
+        pass
+
+    @abstractmethod
+    async def transcribe_audio_stream(self, chunks: AsyncIterator[bytes], language: str = "es") -> str:
+        """Transcribe audio delivered as a stream of chunks."""
+        pass
+
     @abstractmethod
     async def is_audio_supported(self) -> bool:
         """Check if audio processing is supported."""
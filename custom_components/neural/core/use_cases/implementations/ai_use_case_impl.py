@@ -1,11 +1,13 @@
 """AI use case implementation."""
 
 import logging
+from operator import attrgetter
 from typing import List, Optional
 
 from ...api.models.domain.ai import AIStatus, AIResponse
 from ...repositories.interfaces.ai_repository import AIRepository
 from ..interfaces.ai_use_case import AIUseCase
+from ...utils.text_utils import truncate
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,12 +22,12 @@ class AIUseCaseImpl(AIUseCase):
     async def send_message(self, message: str, model: Optional[str] = None) -> AIResponse:
         """Send a message to AI and get response."""
         try:
-            _LOGGER.info("Sending message to AI: %s", message[:50] + "..." if len(message) > 50 else message)
+            _LOGGER.info("Sending message to AI: %s", truncate(message))
             
             # Send message through repository
             response = await self._ai_repository.send_message(message, model)
             
-            _LOGGER.info("Received AI response: %s", response.response[:50] + "..." if len(response.response) > 50 else response.response)
+            _LOGGER.info("Received AI response: %s", truncate(response.response))
             
             return response
             
@@ -57,7 +59,7 @@ class AIUseCaseImpl(AIUseCase):
             # Get models through repository
             models = await self._ai_repository.list_models()
             
-            model_names = [model.name for model in models]
+            model_names = list(map(attrgetter("name"), models))
             _LOGGER.info("Found %d AI models: %s", len(model_names), model_names)
             
             return model_names
@@ -1,13 +1,18 @@
 """Audio use case implementation."""
 
 import logging
-from typing import List
+import time
+from typing import AsyncIterator, List, Optional
 
 from ...repositories.interfaces.audio_repository import AudioRepository
 from ..interfaces.audio_use_case import AudioUseCase
+from ...utils.text_utils import truncate
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a successful support or language probe is reused before asking again
+PROBE_TTL = 300
+
 
 class AudioUseCaseImpl(AudioUseCase):
     """Audio use case implementation."""
@@ -15,24 +20,55 @@ class AudioUseCaseImpl(AudioUseCase):
     def __init__(self, audio_repository: AudioRepository) -> None:
         """Initialize the audio use case."""
         self._audio_repository = audio_repository
+        # The repository reports failures as False / ["es"], so only positive
+        # support is cached and every probe expires after PROBE_TTL
+        self._supported_at: Optional[float] = None
+        self._languages_cache: Optional[List[str]] = None
+        self._languages_at: Optional[float] = None
 
     async def transcribe_audio(self, audio_data: bytes, language: str = "es") -> str:
         """Transcribe audio to text using audio repository."""
+        transcriptions = await self.transcribe_audio_batch([audio_data], language)
+        return transcriptions[0]
+
+    async def transcribe_audio_batch(self, audio_batch: List[bytes], language: str = "es") -> List[str]:
+        """Transcribe several audio clips in one repository call, preserving input order."""
         try:
-            _LOGGER.info("Transcribing audio with language: %s", language)
-            
-            # Use the audio repository to transcribe the audio
-            transcription = await self._audio_repository.transcribe_audio(audio_data, language)
-            
-            _LOGGER.info("Audio transcription completed: %s", transcription[:50] + "..." if len(transcription) > 50 else transcription)
-            return transcription
-            
+            _LOGGER.info("Transcribing %d audio clips with language: %s", len(audio_batch), language)
+
+            if not audio_batch:
+                return []
+
+            # The repository returns transcriptions in the order of the clips
+            transcriptions = await self._audio_repository.transcribe_audio_batch(audio_batch, language)
+
+            for transcription in transcriptions:
+                _LOGGER.info("Audio transcription completed: %s", truncate(transcription))
+            return transcriptions
+
         except Exception as e:
             _LOGGER.error("Failed to transcribe audio: %s", e)
             raise
 
+    async def transcribe_audio_stream(self, chunks: AsyncIterator[bytes], language: str = "es") -> str:
+        """Transcribe streamed audio chunks using audio repository."""
+        try:
+            _LOGGER.info("Transcribing audio stream with language: %s", language)
+
+            transcription = await self._audio_repository.transcribe_audio_stream(chunks, language)
+
+            _LOGGER.info("Audio stream transcription completed: %s", truncate(transcription))
+            return transcription
+
+        except Exception as e:
+            _LOGGER.error("Failed to transcribe audio stream: %s", e)
+            raise
+
     async def is_audio_supported(self) -> bool:
         """Check if audio processing is supported."""
+        if self._is_fresh(self._supported_at):
+            return True
+
         try:
             _LOGGER.info("Checking if audio processing is supported")
             
@@ -40,6 +76,7 @@ class AudioUseCaseImpl(AudioUseCase):
             is_supported = await self._audio_repository.is_audio_supported()
             
             _LOGGER.info("Audio processing support: %s", "supported" if is_supported else "not supported")
+            self._supported_at = time.monotonic() if is_supported else None
             return is_supported
             
         except Exception as e:
@@ -48,6 +85,9 @@ class AudioUseCaseImpl(AudioUseCase):
 
     async def get_supported_languages(self) -> List[str]:
         """Get list of supported languages for audio transcription."""
+        if self._is_fresh(self._languages_at):
+            return list(self._languages_cache)
+
         try:
             _LOGGER.info("Getting supported languages for audio transcription")
             
@@ -55,8 +95,37 @@ class AudioUseCaseImpl(AudioUseCase):
             supported_languages = await self._audio_repository.get_supported_languages()
             
             _LOGGER.info("Supported languages: %s", supported_languages)
+            self._languages_cache = list(supported_languages)
+            self._languages_at = time.monotonic()
             return supported_languages
             
         except Exception as e:
             _LOGGER.error("Failed to get supported languages: %s", e)
             return ["es"]  # Default to Spanish
+
+    async def test_audio_connection(self) -> bool:
+        """Test connection to audio processing service."""
+        try:
+            _LOGGER.info("Testing audio processing service connection")
+            
+            # Test the connection through the audio repository
+            is_available = await self._audio_repository.test_audio_connection()
+            
+            _LOGGER.info("Audio processing service connection test: %s", "success" if is_available else "failed")
+            return is_available
+            
+        except Exception as e:
+            _LOGGER.error("Failed to test audio connection: %s", e)
+            return False
+
+    def invalidate_cache(self) -> None:
+        """Forget cached support and language results."""
+        self._supported_at = None
+        self._languages_cache = None
+        self._languages_at = None
+        _LOGGER.debug("Audio use case cache invalidated")
+
+    @staticmethod
+    def _is_fresh(fetched_at: Optional[float]) -> bool:
+        """Check whether a probe made at fetched_at is still within PROBE_TTL."""
+        return fetched_at is not None and time.monotonic() - fetched_at < PROBE_TTL
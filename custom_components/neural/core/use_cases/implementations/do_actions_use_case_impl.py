@@ -1,10 +1,12 @@
 """Implementation of do actions use case."""
 
 import logging
-from typing import List
+from typing import List, Optional
 
 from ..interfaces.do_actions_use_case import DoActionsUseCase, ActionExecutionResult, ActionsExecutionResponse
 from ..interfaces.decision_use_case import DecisionAction
+from ..interfaces.ha_use_case import HAUseCase
+from ...api.models.domain.ha_entity import EntitySnapshot
 from ...repositories.interfaces.ha_repository import HARepository
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,14 +18,16 @@ class DoActionsUseCaseImpl(DoActionsUseCase):
     Executes actions on Home Assistant through the HA repository.
     """
     
-    def __init__(self, ha_repository: HARepository):
+    def __init__(self, ha_repository: HARepository, ha_use_case: HAUseCase):
         """
         Initialize the DoActionsUseCaseImpl.
         
         Args:
             ha_repository: Home Assistant repository for executing actions
+            ha_use_case: Home Assistant use case providing the entity snapshot
         """
         self._ha_repository = ha_repository
+        self._ha_use_case = ha_use_case
     
     async def execute_actions(self, actions: List[DecisionAction]) -> ActionsExecutionResponse:
         """
@@ -42,57 +46,69 @@ class DoActionsUseCaseImpl(DoActionsUseCase):
         try:
             _LOGGER.warning("DoActionsUseCase.execute_actions called with: %s", type(actions))
             _LOGGER.warning("Actions content: %s", actions)
-            _LOGGER.warning("Executing %d actions", len(actions))
             
             # Validate inputs
             if not actions:
                 raise ValueError("Actions list cannot be empty")
             
-            if not isinstance(actions, list):
-                raise ValueError("Actions must be a list")
+            n = len(actions)
+            _LOGGER.warning("Executing %d actions", n)
+            
+            # Validate every action up front against the shared snapshot
+            validations = await self._validate_actions(actions)
             
             # Execute each action
-            results = []
+            results: List[Optional[ActionExecutionResult]] = [None] * n
             successful_count = 0
             failed_count = 0
             
-            for i, action in enumerate(actions):
-                _LOGGER.debug("Executing action %d/%d: %s.%s", i + 1, len(actions), action.entity, action.action)
+            for idx, (action, is_valid) in enumerate(zip(actions, validations), 1):
+                ent = action.entity
+                act = action.action
+                _LOGGER.debug("Executing action %d/%d: %s.%s", idx, n, ent, act)
                 
                 try:
-                    result = await self.execute_single_action(action)
-                    results.append(result)
+                    if is_valid:
+                        result = await self._do_call_service(action, ent.partition('.')[0])
+                    else:
+                        result = ActionExecutionResult(
+                            success=False,
+                            entity=ent,
+                            action=act,
+                            error_message="Action validation failed"
+                        )
+                    results[idx - 1] = result
                     
                     if result.success:
                         successful_count += 1
                         _LOGGER.info("Action %d/%d executed successfully: %s.%s", 
-                                   i + 1, len(actions), action.entity, action.action)
+                                   idx, n, ent, act)
                     else:
                         failed_count += 1
                         _LOGGER.warning("Action %d/%d failed: %s.%s - %s", 
-                                      i + 1, len(actions), action.entity, action.action, result.error_message)
+                                      idx, n, ent, act, result.error_message)
                         
                 except Exception as e:
-                    _LOGGER.error("Error executing action %d/%d: %s", i + 1, len(actions), e)
+                    _LOGGER.error("Error executing action %d/%d: %s", idx, n, e)
                     failed_count += 1
-                    results.append(ActionExecutionResult(
+                    results[idx - 1] = ActionExecutionResult(
                         success=False,
-                        entity=action.entity,
-                        action=action.action,
+                        entity=ent,
+                        action=act,
                         error_message=str(e)
-                    ))
+                    )
             
             # Create response
             response = ActionsExecutionResponse(
-                message=f"Executed {len(actions)} actions: {successful_count} successful, {failed_count} failed",
+                message=f"Executed {n} actions: {successful_count} successful, {failed_count} failed",
                 results=results,
-                total_actions=len(actions),
+                total_actions=n,
                 successful_actions=successful_count,
                 failed_actions=failed_count
             )
             
             _LOGGER.warning("Actions execution completed: %d/%d successful (%.1f%%)", 
-                        successful_count, len(actions), response.success_rate)
+                        successful_count, n, response.success_rate)
             _LOGGER.warning("ActionsExecutionResponse created: %s", response)
             _LOGGER.warning("Response message: %s", response.message)
             _LOGGER.warning("Response results: %s", response.results)
@@ -124,10 +140,10 @@ class DoActionsUseCaseImpl(DoActionsUseCase):
             _LOGGER.debug("Executing single action: %s.%s", action.entity, action.action)
             
             # Validate action
-            if not action.entity or not action.entity.strip():
+            if not isinstance(action.entity, str) or not action.entity.strip():
                 raise ValueError("Action entity cannot be empty")
             
-            if not action.action or not action.action.strip():
+            if not isinstance(action.action, str) or not action.action.strip():
                 raise ValueError("Action name cannot be empty")
             
             # Validate action before execution
@@ -140,33 +156,8 @@ class DoActionsUseCaseImpl(DoActionsUseCase):
                     error_message="Action validation failed"
                 )
             
-            # Execute the action through HA repository
-            try:
-                response_data = await self._ha_repository.call_service(
-                    domain=action.entity.split('.')[0],
-                    service=action.action,
-                    entity_id=action.entity,
-                    service_data=action.parameters or {}
-                )
-                
-                _LOGGER.info("Action executed successfully: %s.%s", action.entity, action.action)
-                
-                return ActionExecutionResult(
-                    success=True,
-                    entity=action.entity,
-                    action=action.action,
-                    response_data=response_data
-                )
-                
-            except Exception as e:
-                _LOGGER.error("Error calling HA service for %s.%s: %s", action.entity, action.action, e)
-                return ActionExecutionResult(
-                    success=False,
-                    entity=action.entity,
-                    action=action.action,
-                    error_message=str(e)
-                )
-                
+            return await self._do_call_service(action, action.entity.partition('.')[0])
+            
         except ValueError as e:
             _LOGGER.error("Error executing single action: %s", e)
             raise
@@ -174,71 +165,134 @@ class DoActionsUseCaseImpl(DoActionsUseCase):
             _LOGGER.error("Error executing single action: %s", e)
             raise OSError(f"Error executing single action: {e}")
     
-    async def validate_action(self, action: DecisionAction) -> bool:
+    async def _do_call_service(self, action: DecisionAction, domain: str) -> ActionExecutionResult:
         """
-        Validate if an action can be executed.
+        Call the Home Assistant service for an already validated action.
         
         Args:
-            action: Action to validate
+            action: Action to execute
+            domain: Domain of the action entity
             
         Returns:
-            True if action is valid, False otherwise
+            ActionExecutionResult with execution result
         """
         try:
-            _LOGGER.debug("Validating action: %s.%s", action.entity, action.action)
+            response_data = await self._ha_repository.call_service(
+                domain=domain,
+                service=action.action,
+                entity_id=action.entity,
+                service_data=action.parameters or {}
+            )
             
-            # Basic validation
-            if not action.entity or not action.entity.strip():
-                _LOGGER.warning("Action entity is empty")
-                return False
+            _LOGGER.info("Action executed successfully: %s.%s", action.entity, action.action)
             
-            if not action.action or not action.action.strip():
-                _LOGGER.warning("Action name is empty")
-                return False
+            return ActionExecutionResult(
+                success=True,
+                entity=action.entity,
+                action=action.action,
+                response_data=response_data
+            )
             
-            # Extract domain from entity
-            if '.' not in action.entity:
-                _LOGGER.warning("Invalid entity format: %s", action.entity)
-                return False
+        except Exception as e:
+            _LOGGER.error("Error calling HA service for %s.%s: %s", action.entity, action.action, e)
+            return ActionExecutionResult(
+                success=False,
+                entity=action.entity,
+                action=action.action,
+                error_message=str(e)
+            )
+    
+    async def validate_action(self, action: DecisionAction) -> bool:
+        """
+        Validate if an action can be executed.
+        
+        Args:
+            action: Action to validate
             
-            domain = action.entity.split('.')[0]
-            entity_id = action.entity.split('.')[1]
+        Returns:
+            True if action is valid, False otherwise
+        """
+        validations = await self._validate_actions([action])
+        return validations[0]
+    
+    async def _validate_actions(self, actions: List[DecisionAction]) -> List[bool]:
+        """
+        Validate actions against the shared snapshot, refreshing it at most once.
+        
+        Args:
+            actions: Actions to validate
             
-            if not domain or not entity_id:
-                _LOGGER.warning("Invalid entity format: %s", action.entity)
-                return False
+        Returns:
+            Whether each action is valid, in the order of the actions
+        """
+        validations: List[bool] = []
+        snapshot: Optional[EntitySnapshot] = None
+        fetched = refreshed = False
+        
+        for action in actions:
+            _LOGGER.debug("Validating action: %s.%s", action.entity, action.action)
             
-            # Check if entity exists
-            try:
-                entities = await self._ha_repository.get_all_entities()
-                entity_exists = any(entity.entity_id == action.entity for entity in entities)
-                
-                if not entity_exists:
-                    _LOGGER.warning("Entity does not exist: %s", action.entity)
-                    return False
-                
-            except Exception as e:
-                _LOGGER.warning("Error checking entity existence: %s", e)
-                # Continue validation even if we can't check entity existence
-                pass
-            
-            # Check if service exists for the domain
-            try:
-                services = await self._ha_repository.get_services()
-                # This is a basic check - in a real implementation you'd validate
-                # that the specific service exists for the domain
-                if not services:
-                    _LOGGER.warning("No services available")
-                    return False
-                
-            except Exception as e:
-                _LOGGER.warning("Error checking services: %s", e)
-                # Continue validation even if we can't check services
-                pass
+            domain = self._action_domain(action)
+            if domain is None:
+                validations.append(False)
+                continue
             
-            _LOGGER.debug("Action validation passed: %s.%s", action.entity, action.action)
-            return True
+            # Check entity and service existence against the shared snapshot
+            if not fetched:
+                fetched = True
+                try:
+                    snapshot = await self._ha_use_case.get_entity_snapshot()
+                except Exception as e:
+                    _LOGGER.warning("Error checking entity and service existence: %s", e)
+                    # Continue validation even if we can't check existence
             
-        except Exception as e:
-            _LOGGER.error("Error validating action: %s", e)
+            if snapshot is not None and not refreshed and not self._in_snapshot(snapshot, action, domain):
+                # The snapshot may predate a newly added entity or service: check once more
+                # against a fresh one, which the rest of the batch then shares
+                refreshed = True
+                try:
+                    snapshot = await self._ha_use_case.refresh_entity_snapshot()
+                except Exception as e:
+                    _LOGGER.warning("Error refreshing entity snapshot: %s", e)
+            
+            if snapshot is not None and action.entity not in snapshot.entity_ids:
+                _LOGGER.warning("Entity does not exist: %s", action.entity)
+                validations.append(False)
+            elif snapshot is not None and not self._in_snapshot(snapshot, action, domain):
+                _LOGGER.warning("Service does not exist: %s.%s", domain, action.action)
+                validations.append(False)
+            else:
+                _LOGGER.debug("Action validation passed: %s.%s", action.entity, action.action)
+                validations.append(True)
+        
+        return validations
+    
+    @staticmethod
+    def _action_domain(action: DecisionAction) -> Optional[str]:
+        """Check the action fields, returning the entity domain or None if they are invalid."""
+        # The fields come from the AI JSON and may not be strings
+        if not isinstance(action.entity, str) or not action.entity.strip():
+            _LOGGER.warning("Action entity is empty or not a string: %r", action.entity)
+            return None
+        
+        if not isinstance(action.action, str) or not action.action.strip():
+            _LOGGER.warning("Action name is empty or not a string: %r", action.action)
+            return None
+        
+        # Extract domain from entity
+        domain, sep, entity_id = action.entity.partition('.')
+        
+        if not sep or not domain or not entity_id:
+            _LOGGER.warning("Invalid entity format: %s", action.entity)
+            return None
+        
+        return domain
+    
+    @staticmethod
+    def _in_snapshot(snapshot: EntitySnapshot, action: DecisionAction, domain: str) -> bool:
+        """Check whether both the entity and the service of an action are in a snapshot."""
+        if action.entity not in snapshot.entity_ids:
             return False
+        
+        domain_services = snapshot.services.get(domain)
+        return bool(domain_services) and action.action in domain_services
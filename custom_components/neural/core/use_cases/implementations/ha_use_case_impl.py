@@ -1,14 +1,19 @@
 """Home Assistant use case implementation."""
 
+import asyncio
 import logging
+import time
 from typing import Any, Dict, List, Optional
 
-from ...api.models.domain.ha_entity import HAEntity, HAEntitySummary, HAConfig
+from ...api.models.domain.ha_entity import HAEntity, HAEntitySummary, HAConfig, EntitySnapshot
 from ...repositories.interfaces.ha_repository import HARepository
 from ..interfaces.ha_use_case import HAUseCase
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds an entity snapshot is reused before being refreshed
+SNAPSHOT_TTL = 300
+
 
 class HAUseCaseImpl(HAUseCase):
     """Home Assistant use case implementation."""
@@ -16,6 +21,8 @@ class HAUseCaseImpl(HAUseCase):
     def __init__(self, ha_repository: HARepository) -> None:
         """Initialize the Home Assistant use case."""
         self._ha_repository = ha_repository
+        self._snapshot: Optional[EntitySnapshot] = None
+        self._snapshot_lock = asyncio.Lock()
 
     async def get_all_entities(self) -> List[HAEntity]:
         """Get all entities from Home Assistant."""
@@ -216,3 +223,85 @@ class HAUseCaseImpl(HAUseCase):
         except Exception as e:
             _LOGGER.error("Failed to get complete information: %s", e)
             raise
+
+    async def get_bulk(
+        self,
+        entities: bool = True,
+        services: bool = True,
+        config: bool = True,
+        sensors: bool = False,
+        binary_sensors: bool = False,
+        switches: bool = False,
+        lights: bool = False,
+    ) -> Dict[str, Any]:
+        """Get several independent pieces of information concurrently."""
+        try:
+            getters = {
+                "entities": (entities, self.get_all_entities),
+                "services": (services, self.get_services),
+                "config": (config, self.get_config),
+                "sensors": (sensors, self.get_sensors),
+                "binary_sensors": (binary_sensors, self.get_binary_sensors),
+                "switches": (switches, self.get_switches),
+                "lights": (lights, self.get_lights),
+            }
+            labels = [label for label, (enabled, _) in getters.items() if enabled]
+            _LOGGER.info("Getting bulk information from Home Assistant: %s", ", ".join(labels))
+            
+            # Run all requested getters in parallel
+            results = await asyncio.gather(*(getters[label][1]() for label in labels))
+            
+            _LOGGER.info("Retrieved bulk information from Home Assistant")
+            return dict(zip(labels, results))
+            
+        except Exception as e:
+            _LOGGER.error("Failed to get bulk information: %s", e)
+            raise
+
+    async def get_entity_snapshot(self) -> EntitySnapshot:
+        """Get the cached entity ids and services, refreshing them when stale."""
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - snapshot.fetched_at >= SNAPSHOT_TTL:
+            return await self.refresh_entity_snapshot()
+        return snapshot
+
+    async def refresh_entity_snapshot(self) -> EntitySnapshot:
+        """Fetch entity ids and services from Home Assistant into the snapshot."""
+        seen = self._snapshot
+        async with self._snapshot_lock:
+            # Callers that waited on a refresh in progress share its snapshot
+            if self._snapshot is not seen:
+                return self._snapshot
+            
+            try:
+                _LOGGER.info("Refreshing entity snapshot from Home Assistant")
+                
+                entities, services = await asyncio.gather(
+                    self._ha_repository.get_all_entities(),
+                    self._ha_repository.get_services(),
+                )
+                self._snapshot = EntitySnapshot(
+                    entity_ids=frozenset(entity.entity_id for entity in entities),
+                    services=self._index_services(services),
+                    fetched_at=time.monotonic(),
+                )
+                
+                _LOGGER.info("Entity snapshot refreshed: %d entities, %d service domains",
+                            len(self._snapshot.entity_ids), len(self._snapshot.services))
+                return self._snapshot
+                
+            except Exception as e:
+                _LOGGER.error("Failed to refresh entity snapshot: %s", e)
+                raise
+
+    @staticmethod
+    def _index_services(services: Any) -> Dict[str, Dict[str, Any]]:
+        """Index the Home Assistant services payload by domain."""
+        if isinstance(services, dict):
+            return services
+        
+        indexed = {}
+        for service_domain in services or []:
+            if isinstance(service_domain, dict) and "domain" in service_domain:
+                indexed[service_domain["domain"]] = service_domain.get("services") or {}
+        return indexed
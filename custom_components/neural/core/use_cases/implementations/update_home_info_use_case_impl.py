@@ -2,14 +2,91 @@
 Implementation of update home information use case.
 """
 
+import asyncio
 import logging
 import os
-from typing import Optional
+import tempfile
+from typing import Optional, Tuple
 
 from ..interfaces.update_home_info_use_case import UpdateHomeInfoUseCase
 
 _LOGGER = logging.getLogger(__name__)
 
+# Write buffer matching the OS page size
+_WRITE_BUFFER_SIZE = 8192 if os.name == "nt" else 4096
+
+
+def _write_file(path: str, content: str) -> Tuple[int, int]:
+    """
+    Atomically and durably replace a file, returning its new (mtime, size) stamp.
+    
+    The content is written to a temporary file and fsynced before being moved
+    over the target, so readers never observe a partially written file.
+    """
+    payload = content.encode('utf-8')
+    directory = os.path.dirname(os.path.abspath(path))
+    # A unique temporary file per call, so concurrent writers never share one
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + ".", suffix=".tmp")
+    try:
+        with open(fd, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        # Do not leave the temporary file behind when the write fails
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    
+    # Persist the rename itself where the platform allows opening directories
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_file_if_changed(
+    path: str, known_stamp: Optional[Tuple[int, int]]
+) -> Tuple[Optional[Tuple[int, int]], Optional[str]]:
+    """
+    Read a file unless its (mtime, size) stamp matches the known one.
+    
+    The size catches edits made within the same tick on filesystems with
+    coarse timestamps.
+    
+    Returns:
+        (None, None) if the file does not exist, (stamp, None) if it is
+        unchanged, otherwise (stamp, content)
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None, None
+    stamp = (st.st_mtime_ns, st.st_size)
+    if stamp == known_stamp:
+        return stamp, None
+    # Empty files need no open or decode
+    if st.st_size == 0:
+        return stamp, ""
+    with open(path, 'rb') as f:
+        return stamp, f.read(st.st_size).decode('utf-8')
+
+
+def _remove_file(path: str) -> bool:
+    """Remove a file, returning whether it existed."""
+    if not os.path.exists(path):
+        return False
+    os.remove(path)
+    return True
+
 
 class UpdateHomeInfoUseCaseImpl(UpdateHomeInfoUseCase):
     """
@@ -19,6 +96,8 @@ class UpdateHomeInfoUseCaseImpl(UpdateHomeInfoUseCase):
     def __init__(self):
         """Initialize the use case."""
         self._home_info_file = "home_info.md"
+        self._cache: Optional[str] = None
+        self._cache_stamp: Optional[Tuple[int, int]] = None
     
     async def update_home_info(self, home_info: str) -> bool:
         """
@@ -37,17 +116,26 @@ class UpdateHomeInfoUseCaseImpl(UpdateHomeInfoUseCase):
         try:
             _LOGGER.debug("Updating home information")
             
+            # Reject short input on the raw length, before paying for a strip copy
+            if not home_info or len(home_info) < 10:
+                if not home_info or not home_info.strip():
+                    raise ValueError("Home information cannot be empty")
+                raise ValueError("Home information must be at least 10 characters long")
+            
+            stripped = home_info.strip()
+            
             # Validate input
-            if not home_info or not home_info.strip():
+            if not stripped:
                 raise ValueError("Home information cannot be empty")
             
             # Ensure content is not too short (at least 10 characters)
-            if len(home_info.strip()) < 10:
+            if len(stripped) < 10:
                 raise ValueError("Home information must be at least 10 characters long")
             
             # Save to file
-            with open(self._home_info_file, 'w', encoding='utf-8') as f:
-                f.write(home_info.strip())
+            stamp = await asyncio.to_thread(_write_file, self._home_info_file, stripped)
+            self._cache = stripped
+            self._cache_stamp = stamp
             
             _LOGGER.info("Home information updated successfully")
             return True
@@ -69,19 +157,27 @@ class UpdateHomeInfoUseCaseImpl(UpdateHomeInfoUseCase):
         try:
             _LOGGER.debug("Getting home information")
             
-            if not os.path.exists(self._home_info_file):
+            stamp, content = await asyncio.to_thread(
+                _read_file_if_changed, self._home_info_file, self._cache_stamp
+            )
+            if stamp is None:
+                self._cache = None
+                self._cache_stamp = None
                 _LOGGER.info("Home information file not found")
                 return None
             
-            with open(self._home_info_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if content is not None:
+                self._cache = content.strip()
+                self._cache_stamp = stamp
+            else:
+                _LOGGER.debug("Home information served from cache")
             
-            if not content.strip():
+            if not self._cache:
                 _LOGGER.info("Home information file is empty")
                 return None
             
             _LOGGER.info("Home information retrieved successfully")
-            return content.strip()
+            return self._cache
             
         except Exception as e:
             _LOGGER.error("Error getting home information: %s", e)
@@ -100,8 +196,9 @@ class UpdateHomeInfoUseCaseImpl(UpdateHomeInfoUseCase):
         try:
             _LOGGER.debug("Clearing home information")
             
-            if os.path.exists(self._home_info_file):
-                os.remove(self._home_info_file)
+            self._cache = None
+            self._cache_stamp = None
+            if await asyncio.to_thread(_remove_file, self._home_info_file):
                 _LOGGER.info("Home information cleared successfully")
             else:
                 _LOGGER.info("Home information file does not exist")
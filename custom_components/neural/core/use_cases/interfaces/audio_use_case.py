@@ -1,7 +1,7 @@
 """Audio use case interface."""
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
 
 
 class AudioUseCase(ABC):
@@ -12,6 +12,16 @@ class AudioUseCase(ABC):
         """Transcribe audio to text using AI service."""
         pass
 
+    @abstractmethod
+    async def transcribe_audio_batch(self, audio_batch: List[bytes], language: str = "es") -> List[str]:
+        """Transcribe several audio clips in one call, preserving input order."""
+        pass
+
+    @abstractmethod
+    async def transcribe_audio_stream(self, chunks: AsyncIterator[bytes], language: str = "es") -> str:
+        """Transcribe audio delivered as a stream of chunks."""
+        pass
+
     @abstractmethod
     async def is_audio_supported(self) -> bool:
         """Check if audio processing is supported."""
@@ -21,3 +31,13 @@ class AudioUseCase(ABC):
     async def get_supported_languages(self) -> List[str]:
         """Get list of supported languages for audio transcription."""
         pass
+
+    @abstractmethod
+    async def test_audio_connection(self) -> bool:
+        """Test connection to audio processing service."""
+        pass
+
+    @abstractmethod
+    def invalidate_cache(self) -> None:
+        """Forget cached support and language results."""
+        pass
@@ -2,7 +2,8 @@ import abc
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
-@dataclass
+
+@dataclass(slots=True)
 class DecisionAction:
     """Represents an action to be executed in Home Assistant."""
     entity: str
@@ -10,7 +11,7 @@ class DecisionAction:
     parameters: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionResponse:
     """Represents the response from the decision AI."""
     message: str
@@ -33,18 +34,16 @@ class DecisionResponse:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DecisionResponse":
         """Create DecisionResponse from dictionary."""
-        actions = []
-        for action_data in data.get("actions", []):
-            action = DecisionAction(
-                entity=action_data.get("entity", ""),
-                action=action_data.get("action", ""),
-                parameters=action_data.get("parameters")
-            )
-            actions.append(action)
-        
         return cls(
             message=data.get("message", ""),
-            actions=actions
+            actions=[
+                DecisionAction(
+                    entity=action_data.get("entity", ""),
+                    action=action_data.get("action", ""),
+                    parameters=action_data.get("parameters")
+                )
+                for action_data in data.get("actions", [])
+            ]
         )
 
 
@@ -2,7 +2,7 @@
 
 import abc
 from typing import List, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ..interfaces.decision_use_case import DecisionAction
 
@@ -16,7 +16,7 @@ class ActionExecutionResult:
     response_data: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActionsExecutionResponse:
     """Response from executing multiple actions."""
     message: str
@@ -24,13 +24,14 @@ class ActionsExecutionResponse:
     total_actions: int
     successful_actions: int
     failed_actions: int
+    success_rate: float = field(init=False)
     
-    @property
-    def success_rate(self) -> float:
-        """Calculate success rate as percentage."""
-        if self.total_actions == 0:
-            return 0.0
-        return (self.successful_actions / self.total_actions) * 100.0
+    def __post_init__(self):
+        """Calculate success rate as percentage once."""
+        rate = 0.0
+        if self.total_actions:
+            rate = (self.successful_actions / self.total_actions) * 100.0
+        object.__setattr__(self, "success_rate", rate)
 
 
 class DoActionsUseCase(abc.ABC):
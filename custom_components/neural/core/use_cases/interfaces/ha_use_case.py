@@ -1,9 +1,9 @@
 """Home Assistant use case interface."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from ...api.models.domain.ha_entity import HAEntity, HAEntitySummary, HAConfig
+from ...api.models.domain.ha_entity import HAEntity, HAEntitySummary, HAConfig, EntitySnapshot
 
 class HAUseCase(ABC):
     """Interface for Home Assistant use case."""
@@ -67,3 +67,27 @@ class HAUseCase(ABC):
     async def test_connection(self) -> bool:
         """Test connection to Home Assistant."""
         pass
+
+    @abstractmethod
+    async def get_bulk(
+        self,
+        entities: bool = True,
+        services: bool = True,
+        config: bool = True,
+        sensors: bool = False,
+        binary_sensors: bool = False,
+        switches: bool = False,
+        lights: bool = False,
+    ) -> Dict[str, Any]:
+        """Get several independent pieces of information concurrently."""
+        pass
+
+    @abstractmethod
+    async def get_entity_snapshot(self) -> EntitySnapshot:
+        """Get the cached entity ids and services, refreshing them when stale."""
+        pass
+
+    @abstractmethod
+    async def refresh_entity_snapshot(self) -> EntitySnapshot:
+        """Fetch entity ids and services from Home Assistant into the snapshot."""
+        pass
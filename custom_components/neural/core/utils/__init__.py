@@ -1,9 +1,17 @@
 """Utilities for Neural AI integration."""
 
-from .md_utils import read_md_template, get_template_path, list_available_templates
+from .md_utils import (
+    read_md_template,
+    preload_templates,
+    get_template_path,
+    list_available_templates,
+)
+from .text_utils import truncate
 
 __all__ = [
     "read_md_template",
+    "preload_templates",
     "get_template_path", 
-    "list_available_templates"
+    "list_available_templates",
+    "truncate",
 ]
@@ -2,11 +2,27 @@
 
 import os
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
+# Home Assistant context: core/prompts
+_HA_PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+# CLI context: custom_components/neural/core/prompts
+_CLI_PROMPTS_DIR = Path(__file__).parent.parent.parent / "core" / "prompts"
+
+# Template contents keyed on (filename, is_ha_mode), stored with the file mtime
+_TEMPLATE_CACHE: Dict[Tuple[str, bool], Tuple[int, str]] = {}
+_TEMPLATE_CACHE_SIZE = 32
+
+# Template listings keyed on (directory, directory mtime)
+_TEMPLATES_CACHE: Dict[Tuple[str, int], List[str]] = {}
+
+# Templates loaded once at startup, keyed on (filename, is_ha_mode)
+_PRELOADED: Dict[Tuple[str, bool], str] = {}
+
 
 def read_md_template(filename: str, is_ha_mode: bool = False) -> str:
     """
@@ -23,21 +39,30 @@ def read_md_template(filename: str, is_ha_mode: bool = False) -> str:
         FileNotFoundError: If the file cannot be found
         IOError: If the file cannot be read
     """
-    if is_ha_mode:
-        # Home Assistant context: core/prompts/filename
-        base_path = Path(__file__).parent.parent  # Go up from utils to core
-        template_path = base_path / "prompts" / filename
-    else:
-        # CLI context: custom_components/neural/core/prompts/filename
-        base_path = Path(__file__).parent.parent.parent  # Go up from utils to neural
-        template_path = base_path / "core" / "prompts" / filename
+    cache_key = (filename, is_ha_mode)
+    preloaded = _PRELOADED.get(cache_key)
+    if preloaded is not None:
+        return preloaded
     
-    _LOGGER.debug("Reading template from: %s", template_path)
+    template_path = get_template_path(filename, is_ha_mode)
     
     try:
-        with open(template_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        mtime = os.stat(template_path).st_mtime_ns
+        cached = _TEMPLATE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            # Mark as most recently used
+            _TEMPLATE_CACHE[cache_key] = _TEMPLATE_CACHE.pop(cache_key)
+            return cached[1]
+        
+        _LOGGER.debug("Reading template from: %s", template_path)
+        content = Path(template_path).read_text(encoding="utf-8")
         _LOGGER.debug("Successfully read template: %s (%d characters)", filename, len(content))
+        
+        _TEMPLATE_CACHE.pop(cache_key, None)
+        _TEMPLATE_CACHE[cache_key] = (mtime, content)
+        if len(_TEMPLATE_CACHE) > _TEMPLATE_CACHE_SIZE:
+            # Evict the least recently used template
+            del _TEMPLATE_CACHE[next(iter(_TEMPLATE_CACHE))]
         return content
     except FileNotFoundError:
         _LOGGER.error("Template file not found: %s", template_path)
@@ -47,6 +72,31 @@ def read_md_template(filename: str, is_ha_mode: bool = False) -> str:
         raise IOError(f"Error reading template file {template_path}: {e}")
 
 
+def preload_templates(is_ha_mode: bool = False) -> Dict[str, str]:
+    """
+    Read every available template once so later reads skip the filesystem.
+    
+    Prompts ship with the integration and do not change at runtime. Call this
+    during setup, outside the event loop.
+    
+    Args:
+        is_ha_mode: If True, loads from HA context path, otherwise from CLI context
+        
+    Returns:
+        Mapping of filename to its content
+    """
+    templates = {
+        filename: read_md_template(filename, is_ha_mode)
+        for filename in list_available_templates(is_ha_mode)
+    }
+    for filename, content in templates.items():
+        _PRELOADED[(filename, is_ha_mode)] = content
+    
+    _LOGGER.debug("Preloaded %d templates", len(templates))
+    return templates
+
+
+@lru_cache(maxsize=32)
 def get_template_path(filename: str, is_ha_mode: bool = False) -> str:
     """
     Get the full path to a template file without reading it.
@@ -58,14 +108,8 @@ def get_template_path(filename: str, is_ha_mode: bool = False) -> str:
     Returns:
         Full path to the template file
     """
-    if is_ha_mode:
-        base_path = Path(__file__).parent.parent
-        template_path = base_path / "prompts" / filename
-    else:
-        base_path = Path(__file__).parent.parent.parent
-        template_path = base_path / "core" / "prompts" / filename
-    
-    return str(template_path)
+    base_path = _HA_PROMPTS_DIR if is_ha_mode else _CLI_PROMPTS_DIR
+    return str(base_path / filename)
 
 
 def list_available_templates(is_ha_mode: bool = False) -> list[str]:
@@ -78,18 +122,27 @@ def list_available_templates(is_ha_mode: bool = False) -> list[str]:
     Returns:
         List of available template filenames
     """
-    if is_ha_mode:
-        base_path = Path(__file__).parent.parent / "prompts"
-    else:
-        base_path = Path(__file__).parent.parent.parent / "core" / "prompts"
+    base_path = _HA_PROMPTS_DIR if is_ha_mode else _CLI_PROMPTS_DIR
     
-    if not base_path.exists():
+    base_path_str = str(base_path)
+    try:
+        dir_mtime = os.stat(base_path_str).st_mtime_ns
+    except FileNotFoundError:
         _LOGGER.warning("Templates directory not found: %s", base_path)
         return []
     
-    templates = []
-    for file_path in base_path.glob("*.md"):
-        templates.append(file_path.name)
+    cache_key = (base_path_str, dir_mtime)
+    cached = _TEMPLATES_CACHE.get(cache_key)
+    if cached is not None:
+        return list(cached)
+    
+    with os.scandir(base_path_str) as entries:
+        templates = [entry.name for entry in entries if entry.name.endswith(".md")]
+    
+    # Drop listings for previous versions of this directory
+    for key in [key for key in _TEMPLATES_CACHE if key[0] == base_path_str]:
+        del _TEMPLATES_CACHE[key]
+    _TEMPLATES_CACHE[cache_key] = templates
     
     _LOGGER.debug("Found %d templates: %s", len(templates), templates)
-    return templates
+    return list(templates)
@@ -0,0 +1,15 @@
+"""Utilities for formatting text in log messages."""
+
+
+def truncate(text: str, length: int = 50) -> str:
+    """
+    Shorten text for logging, appending an ellipsis when it is cut.
+    
+    Args:
+        text: Text to shorten
+        length: Maximum number of characters kept from the text
+        
+    Returns:
+        The original text if it fits, otherwise its first characters followed by "..."
+    """
+    return text if len(text) <= length else text[:length] + "..."
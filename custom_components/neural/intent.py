@@ -8,10 +8,12 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.intent import IntentHandler, IntentResponse
 from homeassistant.helpers import intent
 
-from .const import INTENT_NEURAL_COMMAND
+from .const import DOMAIN, INTENT_NEURAL_COMMAND
 
 _LOGGER = logging.getLogger(__name__)
 
+_ERROR_SPEECH = "Error processing command"
+
 
 class NeuralIntentHandler(IntentHandler):
     """Intent handler for Neural AI commands."""
@@ -24,27 +26,31 @@ class NeuralIntentHandler(IntentHandler):
 
     async def async_handle(self, intent_obj: intent.Intent) -> IntentResponse:
         """Handle the intent."""
+        _LOGGER.warning("Processing Neural AI intent: %s", intent_obj.text)
+        
+        # Get the command from the intent
+        command = intent_obj.text
+        
+        # Create response
+        intent_response = intent_obj.create_response()
+        
+        # Process the command using the coordinator
         try:
-            _LOGGER.warning("Processing Neural AI intent: %s", intent_obj.text)
-            
-            # Get the command from the intent
-            command = intent_obj.text
-            
-            # Process the command using the coordinator
             response = await self.coordinator.process_command(command)
-            
-            # Create response
-            intent_response = intent_obj.create_response()
-            intent_response.async_set_speech(response)
-            
-            _LOGGER.warning("Neural AI response: %s", response)
-            return intent_response
-            
         except Exception as e:
+            # The AI client reports outages and bad credentials as bare
+            # Exception; the pipeline still needs a spoken answer
             _LOGGER.error("Error handling Neural AI intent: %s", e)
-            intent_response = intent_obj.create_response()
-            intent_response.async_set_speech(f"Error processing command: {str(e)}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                intent_response.async_set_speech(f"{_ERROR_SPEECH}: {e}")
+            else:
+                intent_response.async_set_speech(_ERROR_SPEECH)
             return intent_response
+        
+        intent_response.async_set_speech(response)
+        
+        _LOGGER.warning("Neural AI response: %s", response)
+        return intent_response
 
 
 async def async_setup_intents(hass: HomeAssistant, coordinator=None) -> None:
@@ -52,7 +58,6 @@ async def async_setup_intents(hass: HomeAssistant, coordinator=None) -> None:
     try:
         # Get coordinator from hass data if not provided
         if coordinator is None:
-            from .const import DOMAIN
             if DOMAIN in hass.data and "coordinator" in hass.data[DOMAIN]:
                 coordinator = hass.data[DOMAIN]["coordinator"]
             else:
@@ -60,7 +65,6 @@ async def async_setup_intents(hass: HomeAssistant, coordinator=None) -> None:
                 return
         
         # Check if intent is already registered
-        from .const import INTENT_NEURAL_COMMAND
         if INTENT_NEURAL_COMMAND in hass.data.get("intent", {}):
             _LOGGER.warning("Neural AI intent already registered, skipping")
             return
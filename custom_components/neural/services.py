@@ -7,83 +7,59 @@ import logging
 from homeassistant.core import HomeAssistant, ServiceCall
 
 from .const import DOMAIN, SERVICE_SEND_MESSAGE, SERVICE_GET_STATUS, SERVICE_UPDATE_CONFIG
+from .coordinator import NeuralDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Set up Neural AI services."""
+async def async_setup_services(hass: HomeAssistant, coordinator: NeuralDataUpdateCoordinator) -> None:
+    """Set up Neural AI services for the given coordinator."""
     
     async def send_message_service(call: ServiceCall) -> None:
         """Handle send message service."""
+        message = call.data.get("message", "")
+        if not message:
+            _LOGGER.error("No message provided")
+            return
+        
+        # Process the message
         try:
-            message = call.data.get("message", "")
-            if not message:
-                _LOGGER.error("No message provided")
-                return
-            
-            # Get coordinator from any entry
-            coordinators = hass.data.get(DOMAIN, {})
-            if not coordinators:
-                _LOGGER.error("No Neural AI coordinator found")
-                return
-            
-            # Use the first available coordinator
-            coordinator = next(iter(coordinators.values()))
-            
-            # Process the message
             response = await coordinator.process_command(message)
-            
-            # Store response in coordinator data
-            coordinator.last_response = response
-            coordinator.last_command = message
-            
-            _LOGGER.info("Message processed: %s -> %s", message, response)
-            
         except Exception as e:
             _LOGGER.error("Error in send_message service: %s", e)
+            return
+        
+        # Store response in coordinator data
+        coordinator.last_response = response
+        coordinator.last_command = message
+        
+        _LOGGER.info("Message processed: %s -> %s", message, response)
     
     async def get_status_service(call: ServiceCall) -> None:
         """Handle get status service."""
+        # Get status
         try:
-            # Get coordinator from any entry
-            coordinators = hass.data.get(DOMAIN, {})
-            if not coordinators:
-                _LOGGER.error("No Neural AI coordinator found")
-                return
-            
-            # Use the first available coordinator
-            coordinator = next(iter(coordinators.values()))
-            
-            # Get status
             status = await coordinator.get_status()
-            
-            _LOGGER.info("Neural AI Status: %s", status)
-            
         except Exception as e:
             _LOGGER.error("Error in get_status service: %s", e)
+            return
+        
+        _LOGGER.info("Neural AI Status: %s", status)
     
     async def update_config_service(call: ServiceCall) -> None:
         """Handle update config service."""
-        try:
-            # Get coordinator from any entry
-            coordinators = hass.data.get(DOMAIN, {})
-            if not coordinators:
-                _LOGGER.error("No Neural AI coordinator found")
+        # Update configuration
+        new_config = call.data.get("config", {})
+        if new_config:
+            # Entry data is read-only; replace it through the config entries manager
+            try:
+                hass.config_entries.async_update_entry(
+                    coordinator.entry, data={**coordinator.entry.data, **new_config}
+                )
+            except Exception as e:
+                _LOGGER.error("Error in update_config service: %s", e)
                 return
-            
-            # Use the first available coordinator
-            coordinator = next(iter(coordinators.values()))
-            
-            # Update configuration
-            new_config = call.data.get("config", {})
-            if new_config:
-                # Update coordinator configuration
-                coordinator.entry.data.update(new_config)
-                _LOGGER.info("Configuration updated: %s", new_config)
-            
-        except Exception as e:
-            _LOGGER.error("Error in update_config service: %s", e)
+            _LOGGER.info("Configuration updated: %s", new_config)
     
     # Register services
     hass.services.async_register(
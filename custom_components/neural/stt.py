@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator
 
 import aiohttp
 
@@ -21,12 +22,13 @@ from homeassistant.components.stt import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .core.dependency_injection.providers import setup_dependencies, clear_dependencies
 from .core.dependency_injection.injector_container import get_audio_use_case
-
-_LOGGER = logging.getLogger(__name__)
+from .core.use_cases.interfaces.audio_use_case import AudioUseCase
+from .core.utils.text_utils import truncate
 
 from .const import (
     CONF_STT_MODEL,
@@ -35,14 +37,25 @@ from .const import (
 
 from .core.const import (
     DEFAULT_STT_MODEL,
+    STT_TIMEOUT,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
+# STT entities by config entry id, so repeated setups of an entry do not rebuild them
+_ENTITIES: dict[str, NeuralSTTEntity] = {}
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Neural STT entity."""
+    if config_entry.entry_id in _ENTITIES:
+        _LOGGER.debug("Neural STT entity already set up for entry %s", config_entry.entry_id)
+        return
+
     model = config_entry.data.get(CONF_STT_MODEL, DEFAULT_STT_MODEL)
     api_key = config_entry.data.get(CONF_STT_API_KEY, "")
 
@@ -51,17 +64,39 @@ async def async_setup_entry(
         CONF_STT_MODEL: model,
     }
 
-    _LOGGER.warning("Creating Neural STT entity with config: %s", stt_config)
-    async_add_entities([NeuralSTTEntity(hass, stt_config)])
+    _LOGGER.debug("Creating Neural STT entity with config: %s", stt_config)
+    entity = _ENTITIES[config_entry.entry_id] = NeuralSTTEntity(hass, stt_config, config_entry.entry_id)
+    async_add_entities([entity])
+
+
+async def _notify_end(stream: AsyncIterable[bytes], ended: asyncio.Event) -> AsyncIterator[bytes]:
+    """Forward an audio stream and set the event once it is exhausted."""
+    async for chunk in stream:
+        yield chunk
+    ended.set()
+
 
 class NeuralSTTEntity(SpeechToTextEntity):
     """Neural AI STT entity using OpenAI Whisper."""
 
-    def __init__(self, hass: HomeAssistant, config: dict[str, Any]) -> None:
+    # Built once and shared by every instance; callers must not mutate them
+    _SUPPORTED_LANGUAGES = ["es", "en", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"]
+    _SUPPORTED_FORMATS = [AudioFormats.WAV]
+    _SUPPORTED_CODECS = [AudioCodecs.PCM]
+    _SUPPORTED_BIT_RATES = [AudioBitRates.BITRATE_16]
+    _SUPPORTED_SAMPLE_RATES = [AudioSampleRates.SAMPLERATE_16000]
+    _SUPPORTED_CHANNELS = [AudioChannels.CHANNEL_MONO]
+
+    def __init__(self, hass: HomeAssistant, config: dict[str, Any], entry_id: str) -> None:
         """Initialize Neural STT entity."""
         self.hass = hass
         self.config = config
-        self._session: aiohttp.ClientSession | None = None
+        self._entry_id = entry_id
+        # Shared HA session, owned and closed by Home Assistant
+        self._session: aiohttp.ClientSession = async_get_clientsession(hass)
+        self._audio_use_case: AudioUseCase | None = None
+        self._deps_lock = asyncio.Lock()
+        self._timeout: float = STT_TIMEOUT
         
         # Log configuration details (without sensitive data)
         safe_config = {k: v for k, v in config.items() if k != "stt_api_key"}
@@ -84,58 +119,50 @@ class NeuralSTTEntity(SpeechToTextEntity):
     @property
     def supported_languages(self) -> list[str]:
         """Return a list of supported languages."""
-        return ["es", "en", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh"]
+        return self._SUPPORTED_LANGUAGES
 
     @property
     def supported_formats(self) -> list[AudioFormats]:
         """Return a list of supported formats."""
-        return [AudioFormats.WAV]
+        return self._SUPPORTED_FORMATS
 
     @property
     def supported_codecs(self) -> list[AudioCodecs]:
         """Return a list of supported codecs."""
-        return [AudioCodecs.PCM]
+        return self._SUPPORTED_CODECS
 
     @property
     def supported_bit_rates(self) -> list[AudioBitRates]:
         """Return a list of supported bit rates."""
-        return [AudioBitRates.BITRATE_16]
+        return self._SUPPORTED_BIT_RATES
 
     @property
     def supported_sample_rates(self) -> list[AudioSampleRates]:
         """Return a list of supported sample rates."""
-        return [AudioSampleRates.SAMPLERATE_16000]
+        return self._SUPPORTED_SAMPLE_RATES
 
     @property
     def supported_channels(self) -> list[AudioChannels]:
         """Return a list of supported channels."""
-        return [AudioChannels.CHANNEL_MONO]
+        return self._SUPPORTED_CHANNELS
 
     async def async_process_audio_stream(
         self, metadata: SpeechMetadata, stream: AsyncIterable[bytes]
     ) -> SpeechResult:
         """Process audio stream and return speech result."""
         try:
-            _LOGGER.warning("Processing audio with Neural STT")
-            _LOGGER.warning("Audio metadata - Language: %s, Format: %s, Codec: %s", 
+            _LOGGER.debug("Processing audio with Neural STT")
+            _LOGGER.debug("Audio metadata - Language: %s, Format: %s, Codec: %s", 
                         metadata.language, metadata.format, metadata.codec)
-            _LOGGER.warning("Audio metadata - Bit rate: %s, Sample rate: %s, Channels: %s", 
+            _LOGGER.debug("Audio metadata - Bit rate: %s, Sample rate: %s, Channels: %s", 
                         metadata.bit_rate, metadata.sample_rate, metadata.channel)
             
-            # Read audio data from stream
-            audio_data = await self._read_audio_stream(stream)
-            _LOGGER.warning("Audio data size: %d bytes", len(audio_data))
-            
-            if not audio_data:
-                _LOGGER.warning("No audio data received")
-                return SpeechResult("", SpeechResultState.ERROR)
-            
-            # Send audio to transcription
-            _LOGGER.warning("Starting audio transcription with language: %s", metadata.language)
-            text = await self._transcribe_audio(audio_data, metadata.language)
+            _LOGGER.debug("Starting audio transcription with language: %s", metadata.language)
+            # Send audio to transcription while it is still being received
+            text = await self._transcribe(stream, metadata.language)
             
             if text:
-                _LOGGER.warning("Transcription successful: %s", text)
+                _LOGGER.debug("Transcription successful: %s", text)
                 return SpeechResult(text, SpeechResultState.SUCCESS)
             else:
                 _LOGGER.error("No transcription result")
@@ -145,56 +172,61 @@ class NeuralSTTEntity(SpeechToTextEntity):
             _LOGGER.error("Error processing audio: %s", e)
             return SpeechResult("", SpeechResultState.ERROR)
 
-    async def _read_audio_stream(self, stream: AsyncIterable[bytes]) -> bytes:
-        """Read audio data from stream."""
-        audio_data = b""
-        chunk_count = 0
+    async def _get_audio_use_case(self) -> AudioUseCase:
+        """Set up dependencies on first use and return the cached audio use case."""
+        async with self._deps_lock:
+            if self._audio_use_case is None:
+                _LOGGER.debug("Setting up dependencies for audio transcription")
+                await setup_dependencies(session=self._session)
+                self._audio_use_case = get_audio_use_case()
+        return self._audio_use_case
+
+    async def _transcribe(self, stream: AsyncIterable[bytes], language: str) -> str:
+        """Transcribe a live stream, returning "" on failure or timeout."""
         try:
-            _LOGGER.warning("Starting to read audio stream")
-            # Handle async generator/iterable
-            async for chunk in stream:
-                audio_data += chunk
-                chunk_count += 1
-                if chunk_count % 10 == 0:  # Log every 10 chunks
-                    _LOGGER.warning("Read %d chunks, total size: %d bytes", chunk_count, len(audio_data))
-        except Exception as e:
-            _LOGGER.error("Error reading audio stream: %s", e)
-            return b""
-        
-        _LOGGER.warning("Audio stream reading completed: %d chunks, %d bytes total", chunk_count, len(audio_data))
-        return audio_data
-
-    async def _transcribe_audio(self, audio_data: bytes, language: str) -> str:
-        """Transcribe audio using the audio use case."""
-        try:
-            _LOGGER.warning("Setting up dependencies for audio transcription")
-            # Setup dependencies
-            await setup_dependencies()
+            audio_use_case = await self._get_audio_use_case()
             
-            try:
-                _LOGGER.warning("Getting audio use case")
-                # Get audio use case
-                audio_use_case = get_audio_use_case()
-                
-                _LOGGER.warning("Calling audio use case transcribe_audio with %d bytes, language: %s", 
-                            len(audio_data), language)
-                # Transcribe audio using the use case
-                transcription = await audio_use_case.transcribe_audio(audio_data, language)
-                
-                _LOGGER.warning("Audio transcription completed: %s", transcription[:50] + "..." if len(transcription) > 50 else transcription)
-                return transcription
-                
-            finally:
-                _LOGGER.warning("Cleaning up dependencies")
-                # Clean up dependencies
-                clear_dependencies()
+            _LOGGER.debug("Transcribing audio stream, language: %s", language)
+            transcription = await self._transcribe_stream(audio_use_case, stream, language)
+            
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Audio transcription completed: %s", truncate(transcription))
+            return transcription
                         
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Audio transcription cancelled %.1f s after the audio ended",
+                          self._timeout)
+            return ""
         except Exception as e:
             _LOGGER.error("Error transcribing audio: %s", e)
             return ""
 
+    async def _transcribe_stream(
+        self, audio_use_case: AudioUseCase, stream: AsyncIterable[bytes], language: str
+    ) -> str:
+        """Transcribe a stream as it arrives, bounding only the time after the audio ends."""
+        ended = asyncio.Event()
+        task = asyncio.ensure_future(
+            audio_use_case.transcribe_audio_stream(_notify_end(stream, ended), language)
+        )
+        ended_waiter = asyncio.ensure_future(ended.wait())
+        try:
+            await asyncio.wait({task, ended_waiter}, return_when=asyncio.FIRST_COMPLETED)
+            return await asyncio.wait_for(task, self._timeout)
+        finally:
+            ended_waiter.cancel()
+            task.cancel()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Forget the entity for its entry and release resources when it is removed."""
+        _ENTITIES.pop(self._entry_id, None)
+        await self.async_cleanup()
+
     async def async_cleanup(self) -> None:
         """Clean up resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        if self._audio_use_case is not None:
+            _LOGGER.debug("Cleaning up dependencies")
+            # A reloaded entry may point at another backend: drop its cached probes
+            self._audio_use_case.invalidate_cache()
+            self._audio_use_case = None
+            clear_dependencies()
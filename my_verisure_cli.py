@@ -12,5 +12,12 @@ from cli.main import main
 import asyncio
 
 if __name__ == "__main__":
+    # Use the libuv-based event loop where available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
@@ -3,28 +3,46 @@
 
 import sys
 import os
+import argparse
+import io
 import subprocess
+import threading
 import time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict
+from types import SimpleNamespace
+from typing import Callable, List, Dict
 
-# Colores para la salida
-class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+# Colores para la salida (vacíos si stdout no es una terminal, p. ej. en logs de CI)
+_ANSI_CODES = {
+    'HEADER': '\033[95m',
+    'OKBLUE': '\033[94m',
+    'OKCYAN': '\033[96m',
+    'OKGREEN': '\033[92m',
+    'WARNING': '\033[93m',
+    'FAIL': '\033[91m',
+    'ENDC': '\033[0m',
+    'BOLD': '\033[1m',
+    'UNDERLINE': '\033[4m',
+}
+
+def _make_colors(tty: bool) -> SimpleNamespace:
+    """Crear la paleta de colores, sin códigos ANSI si la salida no es una terminal."""
+    return SimpleNamespace(**{name: code if tty else '' for name, code in _ANSI_CODES.items()})
+
+Colors = _make_colors(sys.stdout.isatty())
+
+# Prefijos precalculados para los mensajes (los colores no cambian durante la ejecución)
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✅ "
+_ERROR_PREFIX = f"{Colors.FAIL}❌ "
+_WARNING_PREFIX = f"{Colors.WARNING}⚠️  "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ️  "
+_END_NL = f"{Colors.ENDC}\n"
 
 def print_header(title: str):
     """Imprimir un encabezado con formato."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}")
-    print(f"🚀 {title}")
-    print(f"{'='*60}{Colors.ENDC}")
+    sys.stdout.write(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}\n🚀 {title}\n{'='*60}{Colors.ENDC}\n")
 
 def print_section(title: str):
     """Imprimir una sección con formato."""
@@ -33,28 +51,70 @@ def print_section(title: str):
 
 def print_success(message: str):
     """Imprimir un mensaje de éxito."""
-    print(f"{Colors.OKGREEN}✅ {message}{Colors.ENDC}")
+    sys.stdout.write(_SUCCESS_PREFIX + message + _END_NL)
 
 def print_error(message: str):
     """Imprimir un mensaje de error."""
-    print(f"{Colors.FAIL}❌ {message}{Colors.ENDC}")
+    sys.stdout.write(_ERROR_PREFIX + message + _END_NL)
 
 def print_warning(message: str):
     """Imprimir un mensaje de advertencia."""
-    print(f"{Colors.WARNING}⚠️  {message}{Colors.ENDC}")
+    sys.stdout.write(_WARNING_PREFIX + message + _END_NL)
 
 def print_info(message: str):
     """Imprimir un mensaje informativo."""
-    print(f"{Colors.OKCYAN}ℹ️  {message}{Colors.ENDC}")
+    sys.stdout.write(_INFO_PREFIX + message + _END_NL)
+
+class _ThreadOutput(io.TextIOBase):
+    """Stdout que envía la salida de cada hilo a su propio buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer: io.StringIO):
+        """Redirigir la salida del hilo actual al buffer indicado."""
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        return getattr(self._local, 'buffer', self._stream).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._stream).flush()
+
+def run_stage(stage: Callable[..., bool], *args) -> tuple:
+    """Ejecutar una etapa capturando su salida para mostrarla sin mezclarse."""
+    buffer = io.StringIO()
+    sys.stdout.capture(buffer)
+    try:
+        return stage(*args), buffer.getvalue()
+    finally:
+        sys.stdout.capture(None)
+
+def decode_output(data: bytes) -> str:
+    """Decodificar la salida capturada de un comando."""
+    return data.decode('utf-8', errors='replace')
+
+# Código de salida de un comando que no se encuentra (como en la shell)
+COMMAND_NOT_FOUND = 127
+
+def _workers() -> int:
+    """Número de workers: núcleos disponibles para este proceso menos dos de margen."""
+    # sched_getaffinity respeta los límites de CPU de contenedores y runners de CI
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    return max(1, cores - 2)
 
 def run_command(command: List[str], cwd: str = None, capture_output: bool = True) -> Dict:
-    """Ejecutar un comando y retornar el resultado."""
+    """Ejecutar un comando y retornar el resultado.
+    
+    La salida se captura en bytes; decodificarla con decode_output solo cuando
+    se vaya a mostrar.
+    """
     try:
         result = subprocess.run(
             command,
             cwd=cwd,
             capture_output=capture_output,
-            text=True,
             timeout=300  # 5 minutos de timeout
         )
         return {
@@ -67,15 +127,23 @@ def run_command(command: List[str], cwd: str = None, capture_output: bool = True
         return {
             'success': False,
             'returncode': -1,
-            'stdout': '',
-            'stderr': 'Command timed out after 5 minutes'
+            'stdout': b'',
+            'stderr': b'Command timed out after 5 minutes'
+        }
+    except FileNotFoundError as e:
+        # El ejecutable no existe: mismo código que devolvería la shell
+        return {
+            'success': False,
+            'returncode': COMMAND_NOT_FOUND,
+            'stdout': b'',
+            'stderr': str(e).encode()
         }
     except Exception as e:
         return {
             'success': False,
             'returncode': -1,
-            'stdout': '',
-            'stderr': str(e)
+            'stdout': b'',
+            'stderr': str(e).encode()
         }
 
 def run_pytest_tests(test_path: str, test_name: str = None) -> bool:
@@ -87,7 +155,11 @@ def run_pytest_tests(test_path: str, test_name: str = None) -> bool:
         return True  # No es un error si no hay tests
     
     # Comando base de pytest
-    cmd = ["python", "-m", "pytest", test_path, "-v"]
+    cmd = ["python", "-m", "pytest", test_path]
+    
+    # Repartir los tests entre los núcleos disponibles si pytest-xdist está disponible
+    if importlib.util.find_spec("xdist") is not None:
+        cmd += ["-n", str(_workers()), "--dist=loadfile"]
     
     # Ejecutar tests
     result = run_command(cmd)
@@ -96,31 +168,26 @@ def run_pytest_tests(test_path: str, test_name: str = None) -> bool:
         print_success(f"{test_name or test_path} tests completed successfully")
         if result['stdout']:
             # Mostrar solo el resumen final
-            lines = result['stdout'].split('\n')
-            for line in lines[-10:]:  # Últimas 10 líneas
+            # Decodificar solo las últimas 10 líneas
+            lines = result['stdout'].rsplit(b'\n', 10)[-10:]
+            for line in lines:
                 if line.strip():
-                    print(f"  {line}")
+                    print(f"  {decode_output(line)}")
         return True
     else:
         print_error(f"{test_name or test_path} tests failed")
         if result['stdout']:
             print("STDOUT:")
-            print(result['stdout'])
+            print(decode_output(result['stdout']))
         if result['stderr']:
             print("STDERR:")
-            print(result['stderr'])
+            print(decode_output(result['stderr']))
         return False
 
 def run_linting() -> bool:
     """Ejecutar linting del código."""
     print_section("Code Linting")
     
-    # Verificar si flake8 está disponible
-    result = run_command(["flake8", "--version"])
-    if not result['success']:
-        print_warning("flake8 not installed. Skipping linting.")
-        return True
-    
     # Ejecutar flake8 en los directorios principales
     directories = ["cli", "core", "custom_components"]
     all_success = True
@@ -130,12 +197,17 @@ def run_linting() -> bool:
             print_info(f"Linting {directory}/")
             result = run_command(["flake8", directory])
             
+            # Si flake8 no está instalado lo indica la propia ejecución
+            if result['returncode'] == COMMAND_NOT_FOUND:
+                print_warning("flake8 not installed. Skipping linting.")
+                return True
+            
             if result['success']:
                 print_success(f"{directory}/ - No linting errors")
             else:
                 print_error(f"{directory}/ - Linting errors found")
                 if result['stdout']:
-                    print(result['stdout'])
+                    print(decode_output(result['stdout']))
                 all_success = False
     
     return all_success
@@ -144,12 +216,6 @@ def run_type_checking() -> bool:
     """Ejecutar verificación de tipos."""
     print_section("Type Checking")
     
-    # Verificar si mypy está disponible
-    result = run_command(["mypy", "--version"])
-    if not result['success']:
-        print_warning("mypy not installed. Skipping type checking.")
-        return True
-    
     # Ejecutar mypy en los directorios principales
     directories = ["cli", "core"]
     all_success = True
@@ -159,12 +225,17 @@ def run_type_checking() -> bool:
             print_info(f"Type checking {directory}/")
             result = run_command(["mypy", directory])
             
+            # Si mypy no está instalado lo indica la propia ejecución
+            if result['returncode'] == COMMAND_NOT_FOUND:
+                print_warning("mypy not installed. Skipping type checking.")
+                return True
+            
             if result['success']:
                 print_success(f"{directory}/ - No type errors")
             else:
                 print_error(f"{directory}/ - Type errors found")
                 if result['stdout']:
-                    print(result['stdout'])
+                    print(decode_output(result['stdout']))
                 all_success = False
     
     return all_success
@@ -185,17 +256,29 @@ def run_coverage_report() -> bool:
     else:
         print_error("Coverage report generation failed")
         if result['stdout']:
-            print(result['stdout'])
+            print(decode_output(result['stdout']))
         if result['stderr']:
-            print(result['stderr'])
+            print(decode_output(result['stderr']))
         return False
 
+def parse_args() -> argparse.Namespace:
+    """Leer los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Ejecutar todos los tests del proyecto Neural")
+    parser.add_argument(
+        "--coverage",
+        action="store_true",
+        default=os.environ.get("NEURAL_COVERAGE") == "1",
+        help="Ejecutar los tests bajo coverage (también con NEURAL_COVERAGE=1)"
+    )
+    return parser.parse_args()
+
 def main():
     """Función principal."""
+    args = parse_args()
     print_header("Neural - Test Suite")
     
     # Verificar que estamos en el directorio correcto
-    if not Path("cli").exists() or not Path("core").exists():
+    if not Path("cli").exists() or not Path("custom_components/neural/core").exists():
         print_error("This script must be run from the project root directory")
         sys.exit(1)
     
@@ -210,35 +293,42 @@ def main():
     # Ejecutar diferentes tipos de tests
     test_suites = [
         ("CLI Tests", "cli/tests"),
-        ("Core Tests", "core/tests"),
+        ("Core Tests", "tests"),
         ("Integration Tests", "."),  # Tests en el directorio raíz
     ]
     
     results = {}
     
-    # Ejecutar tests
-    for suite_name, test_path in test_suites:
-        success = run_pytest_tests(test_path, suite_name)
-        results[suite_name] = success
-        if not success:
-            all_success = False
-    
-    # Ejecutar linting y type checking
-    linting_success = run_linting()
-    results["Code Linting"] = linting_success
-    if not linting_success:
-        all_success = False
+    # Ejecutar tests, linting y type checking en paralelo.
+    # Con coverage los tests se ejecutan una sola vez, dentro del reporte de cobertura.
+    stages = []
+    if not args.coverage:
+        stages += [(suite_name, run_pytest_tests, (test_path, suite_name)) for suite_name, test_path in test_suites]
+    stages.append(("Code Linting", run_linting, ()))
+    stages.append(("Type Checking", run_type_checking, ()))
     
-    type_checking_success = run_type_checking()
-    results["Type Checking"] = type_checking_success
-    if not type_checking_success:
-        all_success = False
+    stdout = sys.stdout
+    sys.stdout = _ThreadOutput(stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [(name, executor.submit(run_stage, stage, *args)) for name, stage, args in stages]
+            for name, future in futures:
+                success, output = future.result()
+                stdout.write(output)
+                results[name] = success
+                if not success:
+                    all_success = False
+    finally:
+        sys.stdout = stdout
     
-    # Generar reporte de cobertura
-    coverage_success = run_coverage_report()
-    results["Coverage Report"] = coverage_success
-    if not coverage_success:
-        all_success = False
+    # Generar reporte de cobertura solo cuando se pide
+    if args.coverage:
+        coverage_success = run_coverage_report()
+        results["Coverage Report"] = coverage_success
+        if not coverage_success:
+            all_success = False
+    else:
+        print_info("Coverage skipped. Use --coverage or NEURAL_COVERAGE=1 to generate it.")
     
     # Resumen final
     end_time = time.time()
@@ -3,27 +3,65 @@
 
 import sys
 import os
+import io
 import subprocess
+import tempfile
+import threading
+import importlib.util
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import redirect_stdout
 import time
 from pathlib import Path
+from types import SimpleNamespace
 
-# Colores para la salida
-class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+def _workers() -> int:
+    """Número de workers: núcleos disponibles para este proceso menos dos de margen."""
+    # sched_getaffinity respeta los límites de CPU de contenedores y runners de CI
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    return max(1, cores - 2)
+
+# Repartir los tests entre los núcleos disponibles si pytest-xdist está disponible
+XDIST_ARGS = ["-n", str(_workers()), "--dist=loadfile"] if importlib.util.find_spec("xdist") else []
+
+# Medir coverage en la misma sesión de pytest si pytest-cov está disponible
+COVERAGE_ARGS = ["--cov=cli", "--cov-report=html:htmlcov/cli"] if importlib.util.find_spec("pytest_cov") else []
+
+# Código de salida de un comando que no se encuentra (como en la shell)
+COMMAND_NOT_FOUND = 127
+
+# Estructura del proyecto, comprobada una sola vez
+_HAS_CLI = Path("cli").is_dir()
+
+# Colores para la salida (vacíos si stdout no es una terminal, p. ej. en logs de CI)
+_ANSI_CODES = {
+    'HEADER': '\033[95m',
+    'OKBLUE': '\033[94m',
+    'OKCYAN': '\033[96m',
+    'OKGREEN': '\033[92m',
+    'WARNING': '\033[93m',
+    'FAIL': '\033[91m',
+    'ENDC': '\033[0m',
+    'BOLD': '\033[1m',
+    'UNDERLINE': '\033[4m',
+}
+
+def _make_colors(tty: bool) -> SimpleNamespace:
+    """Crear la paleta de colores, sin códigos ANSI si la salida no es una terminal."""
+    return SimpleNamespace(**{name: code if tty else '' for name, code in _ANSI_CODES.items()})
+
+Colors = _make_colors(sys.stdout.isatty())
+
+# Prefijos precalculados para los mensajes (los colores no cambian durante la ejecución)
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✅ "
+_ERROR_PREFIX = f"{Colors.FAIL}❌ "
+_WARNING_PREFIX = f"{Colors.WARNING}⚠️  "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ️  "
+_END_NL = f"{Colors.ENDC}\n"
 
 def print_header(title: str):
     """Imprimir un encabezado con formato."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}")
-    print(f"🚀 {title}")
-    print(f"{'='*60}{Colors.ENDC}")
+    sys.stdout.write(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}\n🚀 {title}\n{'='*60}{Colors.ENDC}\n")
 
 def print_section(title: str):
     """Imprimir una sección con formato."""
@@ -32,23 +70,80 @@ def print_section(title: str):
 
 def print_success(message: str):
     """Imprimir un mensaje de éxito."""
-    print(f"{Colors.OKGREEN}✅ {message}{Colors.ENDC}")
+    sys.stdout.write(_SUCCESS_PREFIX + message + _END_NL)
 
 def print_error(message: str):
     """Imprimir un mensaje de error."""
-    print(f"{Colors.FAIL}❌ {message}{Colors.ENDC}")
+    sys.stdout.write(_ERROR_PREFIX + message + _END_NL)
 
 def print_warning(message: str):
     """Imprimir un mensaje de advertencia."""
-    print(f"{Colors.WARNING}⚠️  {message}{Colors.ENDC}")
+    sys.stdout.write(_WARNING_PREFIX + message + _END_NL)
 
 def print_info(message: str):
     """Imprimir un mensaje informativo."""
-    print(f"{Colors.OKCYAN}ℹ️  {message}{Colors.ENDC}")
+    sys.stdout.write(_INFO_PREFIX + message + _END_NL)
+
+def run_command_tail(command: list, cwd: str = None, tail: int = 10) -> dict:
+    """Ejecutar un comando guardando en memoria solo las últimas líneas de stdout.
+    
+    La salida completa se vuelca a un fichero temporal y solo se lee si el
+    comando falla, para poder mostrar el detalle del error.
+    """
+    process = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    
+    # Vaciar stderr en paralelo para que el proceso no se bloquee con el pipe lleno
+    stderr_chunks = []
+    drain = threading.Thread(target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True)
+    drain.start()
+    
+    # Matar el proceso si supera el timeout mientras se lee su salida
+    timer = threading.Timer(300, process.kill)
+    timer.start()
+    
+    tail_lines = deque(maxlen=tail)
+    with tempfile.TemporaryFile(mode='w+', encoding='utf-8') as log:
+        try:
+            for line in process.stdout:
+                log.write(line)
+                tail_lines.append(line.rstrip('\n'))
+            returncode = process.wait()
+            drain.join()
+        finally:
+            timed_out = not timer.is_alive()
+            timer.cancel()
+        
+        if timed_out:
+            raise subprocess.TimeoutExpired(command, 300)
+        
+        if returncode == 0:
+            stdout = '\n'.join(tail_lines)
+        else:
+            log.seek(0)
+            stdout = log.read()
+    
+    return {
+        'success': returncode == 0,
+        'returncode': returncode,
+        'stdout': stdout,
+        'stderr': ''.join(stderr_chunks)
+    }
 
-def run_command(command: list, cwd: str = None) -> dict:
-    """Ejecutar un comando y retornar el resultado."""
+def run_command(command: list, cwd: str = None, tail: int = None) -> dict:
+    """Ejecutar un comando y retornar el resultado.
+    
+    Con tail=N, si el comando termina bien stdout contiene solo sus últimas N líneas.
+    """
     try:
+        if tail:
+            return run_command_tail(command, cwd=cwd, tail=tail)
+        
         result = subprocess.run(
             command,
             cwd=cwd,
@@ -69,6 +164,14 @@ def run_command(command: list, cwd: str = None) -> dict:
             'stdout': '',
             'stderr': 'Command timed out after 5 minutes'
         }
+    except FileNotFoundError as e:
+        # El ejecutable no existe: mismo código que devolvería la shell
+        return {
+            'success': False,
+            'returncode': COMMAND_NOT_FOUND,
+            'stdout': '',
+            'stderr': str(e)
+        }
     except Exception as e:
         return {
             'success': False,
@@ -77,30 +180,42 @@ def run_command(command: list, cwd: str = None) -> dict:
             'stderr': str(e)
         }
 
-def run_cli_tests() -> bool:
-    """Ejecutar tests del CLI."""
+def run_cli_coverage() -> tuple:
+    """Ejecutar tests del CLI con coverage en una sola sesión de pytest.
+    
+    Retorna (success, coverage_ok): si los tests pasaron y si se generó el
+    reporte de coverage.
+    """
     print_section("CLI Tests")
     
     cli_tests_dir = Path("cli/tests")
     if not cli_tests_dir.exists():
         print_error(f"Directorio de tests CLI no encontrado: {cli_tests_dir}")
-        return False
+        return False, False
     
-    # Ejecutar tests del CLI
+    # Ejecutar tests del CLI desde la raíz para usar la configuración de pytest.ini,
+    # generando el reporte de coverage en la misma sesión
     result = run_command(
-        ["python", "-m", "pytest", "-v", "--tb=short"],
-        cwd=str(cli_tests_dir)
+        ["python", "-m", "pytest", str(cli_tests_dir)] + COVERAGE_ARGS + XDIST_ARGS,
+        tail=10
     )
     
+    # pytest-cov escribe el reporte siempre que la sesión llegue a ejecutar los tests
+    # (código 0 si pasan, 1 si alguno falla)
+    coverage_ok = bool(COVERAGE_ARGS) and result['returncode'] in (0, 1)
+    
     if result['success']:
         print_success("Tests del CLI completados exitosamente")
         if result['stdout']:
-            # Mostrar solo el resumen final
-            lines = result['stdout'].split('\n')
-            for line in lines[-10:]:  # Últimas 10 líneas
+            # Mostrar solo el resumen final (las últimas 10 líneas)
+            for line in result['stdout'].split('\n'):
                 if line.strip():
                     print(f"  {line}")
-        return True
+        if COVERAGE_ARGS:
+            print_info("HTML report available at: htmlcov/cli/index.html")
+        else:
+            print_warning("pytest-cov no está instalado. Tests ejecutados sin coverage.")
+        return True, coverage_ok
     else:
         print_error("Tests del CLI fallaron")
         if result['stdout']:
@@ -109,61 +224,75 @@ def run_cli_tests() -> bool:
         if result['stderr']:
             print("STDERR:")
             print(result['stderr'])
-        return False
+        return False, coverage_ok
 
 def run_linting() -> bool:
-    """Ejecutar linting del código CLI."""
+    """Ejecutar linting, type checking y formato del código CLI."""
     print_section("CLI Code Linting")
     
-    # Verificar si flake8 está disponible
-    result = run_command(["flake8", "--version"])
-    if not result['success']:
-        print_warning("flake8 no está instalado. Saltando linting.")
+    if not _HAS_CLI:
         return True
     
-    # Ejecutar flake8 en el directorio CLI
-    if Path("cli").exists():
-        print_info("Linting cli/")
-        result = run_command(["flake8", "cli"])
-        
-        if result['success']:
-            print_success("cli/ - Sin errores de linting")
-            return True
+    checks = [
+        ("flake8", ["flake8", "cli"]),
+        ("mypy", ["mypy", "cli"]),
+        ("black", ["black", "--check", "cli"]),
+    ]
+    
+    # Las herramientas solo esperan a sus subprocesos, así que bastan hilos.
+    # No se comprueba antes si están instaladas: si falta alguna, su propia
+    # ejecución lo indica con COMMAND_NOT_FOUND
+    print_info("Linting cli/")
+    results = {}
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = {
+            executor.submit(run_command, command): tool_name
+            for tool_name, command in checks
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    # Informar de los fallos en el orden de las herramientas
+    all_ok = True
+    for tool_name, _ in checks:
+        result = results[tool_name]
+        if result['returncode'] == COMMAND_NOT_FOUND:
+            print_warning(f"{tool_name} no está instalado. Saltando.")
+        elif result['success']:
+            print_success(f"{tool_name}: cli/ sin errores")
         else:
-            print_error("cli/ - Errores de linting encontrados")
+            print_error(f"{tool_name}: errores encontrados en cli/")
             if result['stdout']:
                 print(result['stdout'])
-            return False
+            if result['stderr']:
+                print(result['stderr'])
+            all_ok = False
     
-    return True
+    return all_ok
 
-def run_cli_coverage() -> bool:
-    """Ejecutar coverage para CLI."""
-    print_section("CLI Coverage Report")
-    
-    # Usar el script dedicado para coverage de CLI
-    cmd = ["python", "run_coverage.py", "cli"]
+def run_suite(suite_name: str, suite_func) -> tuple:
+    """Ejecutar una suite en un proceso aparte.
     
-    result = run_command(cmd)
-    
-    if result['success']:
-        print_success("CLI coverage report generated successfully")
-        print_info("HTML report available at: htmlcov/cli/index.html")
-        return True
-    else:
-        print_error("CLI coverage report generation failed")
-        if result['stdout']:
-            print(result['stdout'])
-        if result['stderr']:
-            print(result['stderr'])
-        return False
+    Retorna (success, coverage_ok, output); coverage_ok es None para las suites
+    que no miden coverage.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        print_header(suite_name)
+        try:
+            outcome = suite_func()
+        except Exception as e:
+            print_error(f"Error ejecutando {suite_name}: {e}")
+            outcome = False
+    success, coverage_ok = outcome if isinstance(outcome, tuple) else (outcome, None)
+    return success, coverage_ok, buffer.getvalue()
 
 def main():
     """Función principal."""
     print_header("Neural - CLI Test Suite")
     
     # Verificar que estamos en el directorio correcto
-    if not Path("cli").exists():
+    if not _HAS_CLI:
         print_error("Este script debe ejecutarse desde el directorio raíz del proyecto")
         sys.exit(1)
     
@@ -171,25 +300,33 @@ def main():
     all_success = True
     
     # Ejecutar diferentes tipos de tests
+    # (los tests y el coverage comparten una única sesión de pytest)
     test_suites = [
-        ("CLI Tests", run_cli_tests),
+        ("CLI Tests", run_cli_coverage),
         ("CLI Code Linting", run_linting),
-        ("CLI Coverage Report", run_cli_coverage),
     ]
     
     results = {}
+    coverage_ok = None
     
-    for suite_name, suite_func in test_suites:
-        print_header(suite_name)
-        try:
-            success = suite_func()
-            results[suite_name] = success
+    # Ejecutar las suites en paralelo, dejando dos núcleos libres
+    with ProcessPoolExecutor(max_workers=_workers()) as executor:
+        futures = {
+            executor.submit(run_suite, suite_name, suite_func): suite_name
+            for suite_name, suite_func in test_suites
+        }
+        for future in as_completed(futures):
+            success, suite_coverage_ok, output = future.result()
+            # Mostrar la salida de cada suite de una vez al terminar
+            sys.stdout.write(output)
+            results[futures[future]] = success
+            if suite_coverage_ok is not None:
+                coverage_ok = suite_coverage_ok
             if not success:
                 all_success = False
-        except Exception as e:
-            print_error(f"Error ejecutando {suite_name}: {e}")
-            results[suite_name] = False
-            all_success = False
+    
+    # Mantener el orden de las suites en el resumen
+    results = {suite_name: results[suite_name] for suite_name, _ in test_suites}
     
     # Resumen final
     end_time = time.time()
@@ -203,6 +340,12 @@ def main():
         else:
             print_error(f"{suite_name}: FAILED")
     
+    # El coverage no decide el resultado: los tests ya se evaluaron en la misma sesión
+    if coverage_ok:
+        print_success("CLI Coverage Report: GENERATED")
+    elif coverage_ok is not None:
+        print_warning("CLI Coverage Report: NOT GENERATED")
+    
     print(f"\n{Colors.BOLD}Tiempo total: {duration:.2f} segundos{Colors.ENDC}")
     
     if all_success:
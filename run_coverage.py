@@ -4,27 +4,69 @@ Script de coverage que funciona sin conflictos.
 Por ahora ejecuta los tests sin coverage hasta que se resuelva el problema del entorno virtual.
 """
 
+import io
+import os
 import sys
 import time
 import subprocess
+import tempfile
+import importlib.util
 from pathlib import Path
+from types import SimpleNamespace
 
-# Colores para output
-class Colors:
-    HEADER = '\033[95m'
-    OKBLUE = '\033[94m'
-    OKCYAN = '\033[96m'
-    OKGREEN = '\033[92m'
-    WARNING = '\033[93m'
-    FAIL = '\033[91m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
+# Directorio de trabajo y estructura del proyecto, comprobados una sola vez
+_CWD = Path.cwd()
+_HAS_CLI = Path("cli").is_dir()
+_HAS_CORE = Path("custom_components/neural/core").is_dir()
+
+# Colores para la salida (vacíos si stdout no es una terminal, p. ej. en logs de CI)
+_ANSI_CODES = {
+    'HEADER': '\033[95m',
+    'OKBLUE': '\033[94m',
+    'OKCYAN': '\033[96m',
+    'OKGREEN': '\033[92m',
+    'WARNING': '\033[93m',
+    'FAIL': '\033[91m',
+    'ENDC': '\033[0m',
+    'BOLD': '\033[1m',
+}
+
+def _make_colors(tty: bool) -> SimpleNamespace:
+    """Crear la paleta de colores, sin códigos ANSI si la salida no es una terminal."""
+    return SimpleNamespace(**{name: code if tty else '' for name, code in _ANSI_CODES.items()})
+
+Colors = _make_colors(sys.stdout.isatty())
+
+# Prefijos precalculados para los mensajes (los colores no cambian durante la ejecución)
+_SUCCESS_PREFIX = f"{Colors.OKGREEN}✅ "
+_ERROR_PREFIX = f"{Colors.FAIL}❌ "
+_WARNING_PREFIX = f"{Colors.WARNING}⚠️  "
+_INFO_PREFIX = f"{Colors.OKCYAN}ℹ️  "
+_END_NL = f"{Colors.ENDC}\n"
+
+def _workers() -> int:
+    """Número de workers: núcleos disponibles para este proceso menos dos de margen."""
+    # sched_getaffinity respeta los límites de CPU de contenedores y runners de CI
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else (os.cpu_count() or 1)
+    return max(1, cores - 2)
+
+# Repartir los tests entre los núcleos disponibles si pytest-xdist está disponible
+XDIST_ARGS = ["-n", str(_workers()), "--dist=loadfile"] if importlib.util.find_spec("xdist") else []
+
+# Comprobar una sola vez si coverage y pytest-cov están instalados, sin lanzar un intérprete
+# (--cov lo aporta el plugin pytest-cov; sin él pytest rechaza el argumento)
+_COVERAGE_AVAILABLE = (
+    importlib.util.find_spec("coverage") is not None
+    and importlib.util.find_spec("pytest_cov") is not None
+)
+
+if _COVERAGE_AVAILABLE:
+    import coverage
 
 def print_header(text):
     """Imprimir header con formato."""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text:^60}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}")
+    rule = f"{Colors.HEADER}{Colors.BOLD}{'='*60}{Colors.ENDC}"
+    sys.stdout.write(f"\n{rule}\n{Colors.HEADER}{Colors.BOLD}{text:^60}{Colors.ENDC}\n{rule}\n")
 
 def print_section(text):
     """Imprimir sección con formato."""
@@ -33,24 +75,24 @@ def print_section(text):
 
 def print_success(text):
     """Imprimir mensaje de éxito."""
-    print(f"{Colors.OKGREEN}✅ {text}{Colors.ENDC}")
+    sys.stdout.write(_SUCCESS_PREFIX + text + _END_NL)
 
 def print_error(text):
     """Imprimir mensaje de error."""
-    print(f"{Colors.FAIL}❌ {text}{Colors.ENDC}")
+    sys.stdout.write(_ERROR_PREFIX + text + _END_NL)
 
 def print_info(text):
     """Imprimir mensaje informativo."""
-    print(f"{Colors.OKCYAN}ℹ️  {text}{Colors.ENDC}")
+    sys.stdout.write(_INFO_PREFIX + text + _END_NL)
 
 def print_warning(text):
     """Imprimir mensaje de advertencia."""
-    print(f"{Colors.WARNING}⚠️  {text}{Colors.ENDC}")
+    sys.stdout.write(_WARNING_PREFIX + text + _END_NL)
 
 def run_command(cmd):
     """Ejecutar comando y retornar resultado."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=Path.cwd())
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=_CWD)
         return {
             'success': result.returncode == 0,
             'stdout': result.stdout,
@@ -65,234 +107,142 @@ def run_command(cmd):
             'returncode': -1
         }
 
-def run_tests_with_coverage_cli():
-    """Ejecutar tests CLI con coverage (si está disponible)."""
-    print_section("Running CLI Tests with Coverage")
+def run_pytest_with_coverage(suites):
+    """Ejecutar pytest con coverage y retornar si pasó."""
+    # Con varias suites, cada una se ejecuta en su propio proceso en paralelo
+    shards = [(test_path, source) for test_path, source in suites if Path(test_path).is_dir()]
+    if len(shards) > 1:
+        return run_sharded_pytest_with_coverage(shards)
     
-    # Intentar usar coverage si está disponible
-    coverage_available = run_command(["python", "-c", "import coverage; print('available')"])
+    import pytest
     
-    if coverage_available['success']:
-        print_info("Coverage module available, running with coverage...")
-        
-        # Limpiar datos de coverage anteriores
-        run_command(["python", "-m", "coverage", "erase"])
-        
-        # Ejecutar tests CLI con coverage
-        cmd = [
-            "python", "-m", "coverage", "run", "-m", "pytest",
-            "cli/tests"
-        ]
-        
-        result = run_command(cmd)
-        
-        if result['success']:
-            print_success("CLI tests completed successfully")
-            
-            # Generar reportes
-            print_info("Generating CLI coverage reports...")
-            
-            # Reporte de terminal
-            term_result = run_command(["python", "-m", "coverage", "report", "--show-missing"])
-            if term_result['success']:
-                print_success("CLI terminal report generated")
-                if term_result['stdout']:
-                    print("\nCLI Coverage Summary:")
-                    print(term_result['stdout'])
-            
-            # Reporte HTML
-            html_result = run_command(["python", "-m", "coverage", "html", "--directory=htmlcov/cli"])
-            if html_result['success']:
-                print_success("CLI HTML report generated")
-                print_info("HTML report available at: htmlcov/cli/index.html")
-            
-            return True
-        else:
-            print_error("CLI tests failed")
-            if result['stdout']:
-                print("STDOUT:")
-                print(result['stdout'])
-            if result['stderr']:
-                print("STDERR:")
-                print(result['stderr'])
-            return False
-    else:
-        print_warning("Coverage module not available, running tests without coverage...")
-        
-        # Ejecutar tests CLI sin coverage
-        cmd = [
-            "python", "-m", "pytest",
-            "cli/tests"
-        ]
-        
-        result = run_command(cmd)
-        
-        if result['success']:
-            print_success("CLI tests completed successfully (without coverage)")
-            print_info("To enable coverage, install it with: pip install coverage")
-            return True
-        else:
-            print_error("CLI tests failed")
-            if result['stdout']:
-                print("STDOUT:")
-                print(result['stdout'])
-            if result['stderr']:
-                print("STDERR:")
-                print(result['stderr'])
-            return False
+    # pytest-cov mide también los workers de xdist y guarda los datos en .coverage
+    args = [test_path for test_path, _ in suites] + [f"--cov={source}" for _, source in suites]
+    return pytest.main(args + ["--cov-report="] + XDIST_ARGS) == 0
 
-def run_tests_with_coverage_core():
-    """Ejecutar tests Core con coverage (si está disponible)."""
-    print_section("Running Core Tests with Coverage")
+def run_sharded_pytest_with_coverage(shards):
+    """Ejecutar cada suite en un proceso de pytest aparte y combinar su coverage.
     
-    # Intentar usar coverage si está disponible
-    coverage_available = run_command(["python", "-c", "import coverage; print('available')"])
+    Cada proceso escribe en su propio fichero de datos (COVERAGE_FILE) y al
+    terminar se combinan todos en .coverage.
+    """
+    # Repartir los workers de xdist entre las suites
+    shard_xdist_args = ["-n", str(max(1, _workers() // len(shards))), "--dist=loadfile"] if XDIST_ARGS else []
     
-    if coverage_available['success']:
-        print_info("Coverage module available, running with coverage...")
-        
-        # Limpiar datos de coverage anteriores
-        run_command(["python", "-m", "coverage", "erase"])
-        
-        # Ejecutar tests Core con coverage
-        cmd = [
-            "python", "-m", "coverage", "run", "-m", "pytest",
-            "core/tests"
-        ]
-        
-        result = run_command(cmd)
-        
-        if result['success']:
-            print_success("Core tests completed successfully")
-            
-            # Generar reportes
-            print_info("Generating Core coverage reports...")
-            
-            # Reporte de terminal
-            term_result = run_command(["python", "-m", "coverage", "report", "--show-missing"])
-            if term_result['success']:
-                print_success("Core terminal report generated")
-                if term_result['stdout']:
-                    print("\nCore Coverage Summary:")
-                    print(term_result['stdout'])
-            
-            # Reporte HTML
-            html_result = run_command(["python", "-m", "coverage", "html", "--directory=htmlcov/core"])
-            if html_result['success']:
-                print_success("Core HTML report generated")
-                print_info("HTML report available at: htmlcov/core/index.html")
-            
-            return True
-        else:
-            print_error("Core tests failed")
-            if result['stdout']:
-                print("STDOUT:")
-                print(result['stdout'])
-            if result['stderr']:
-                print("STDERR:")
-                print(result['stderr'])
-            return False
-    else:
-        print_warning("Coverage module not available, running tests without coverage...")
-        
-        # Ejecutar tests Core sin coverage
-        cmd = [
-            "python", "-m", "pytest",
-            "core/tests"
-        ]
-        
-        result = run_command(cmd)
+    processes = []
+    data_files = []
+    for test_path, source in shards:
+        data_file = f".coverage.{source}"
+        cmd = ["python", "-m", "pytest", test_path, f"--cov={source}", "--cov-report="] + shard_xdist_args
+        # La salida va a un fichero temporal para no mezclar la de ambas suites
+        log = tempfile.TemporaryFile(mode='w+', encoding='utf-8')
+        process = subprocess.Popen(
+            cmd,
+            cwd=_CWD,
+            env={**os.environ, "COVERAGE_FILE": data_file},
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+        processes.append((test_path, process, log))
+        data_files.append(data_file)
+    
+    success = True
+    for test_path, process, log in processes:
+        returncode = process.wait()
+        with log:
+            log.seek(0)
+            print_info(f"{test_path}:")
+            print(log.read())
+        if returncode != 0:
+            success = False
+    
+    # Combinar los datos de todas las suites en .coverage
+    cov = coverage.Coverage()
+    cov.combine(data_files)
+    cov.save()
+    
+    return success
+
+def generate_coverage_reports(label, html_dir, xml=False):
+    """Generar los reportes de coverage a partir de los datos guardados."""
+    # Los datos se cargan una sola vez; los reportes son trabajo de CPU en Python,
+    # así que se generan uno tras otro
+    cov = coverage.Coverage()
+    cov.load()
+    
+    buffer = io.StringIO()
+    reports = [
+        ("terminal", lambda: cov.report(show_missing=True, file=buffer)),
+        ("HTML", lambda: cov.html_report(directory=html_dir)),
+    ]
+    if xml:
+        reports.append(("XML", lambda: cov.xml_report(outfile="coverage.xml")))
+    
+    for name, write_report in reports:
+        try:
+            write_report()
+        except coverage.CoverageException as e:
+            print_warning(f"Could not generate {name} report: {e}")
+            continue
         
-        if result['success']:
-            print_success("Core tests completed successfully (without coverage)")
-            print_info("To enable coverage, install it with: pip install coverage")
-            return True
+        print_success(f"{label} {name} report generated")
+        if name == "terminal":
+            print(f"\n{label} Summary:")
+            print(buffer.getvalue())
+        elif name == "HTML":
+            print_info(f"HTML report available at: {html_dir}/index.html")
         else:
-            print_error("Core tests failed")
-            if result['stdout']:
-                print("STDOUT:")
-                print(result['stdout'])
-            if result['stderr']:
-                print("STDERR:")
-                print(result['stderr'])
-            return False
+            print_info("XML report available at: coverage.xml")
 
-def run_tests_with_coverage_all():
-    """Ejecutar todos los tests con coverage (si está disponible)."""
-    print_section("Running All Tests with Coverage")
-    
-    # Intentar usar coverage si está disponible
-    coverage_available = run_command(["python", "-c", "import coverage; print('available')"])
+# Suites de tests (los testpaths de pytest.ini) y el paquete que mide cada una;
+# los tests de core importan el paquete desde custom_components/neural
+CLI_SUITE = ("cli/tests", "cli")
+CORE_SUITE = ("tests", "core")
+
+# Objetivos de coverage: etiqueta, suites, directorio HTML y si genera XML
+COVERAGE_TARGETS = {
+    "cli": ("CLI", [CLI_SUITE], "htmlcov/cli", False),
+    "core": ("Core", [CORE_SUITE], "htmlcov/core", False),
+    "all": ("All", [CLI_SUITE, CORE_SUITE], "htmlcov", True),
+}
+
+def run_tests_with_coverage(label, suites, html_dir, xml=False):
+    """Ejecutar tests con coverage (si está disponible)."""
+    print_section(f"Running {label} Tests with Coverage")
     
-    if coverage_available['success']:
-        print_info("Coverage module available, running with coverage...")
+    if _COVERAGE_AVAILABLE:
+        print_info("Coverage and pytest-cov available, running with coverage...")
         
         # Limpiar datos de coverage anteriores
-        run_command(["python", "-m", "coverage", "erase"])
+        coverage.Coverage().erase()
         
         # Ejecutar tests con coverage
-        cmd = [
-            "python", "-m", "coverage", "run", "-m", "pytest",
-            "cli/tests",
-            "core/tests"
-        ]
-        
-        result = run_command(cmd)
-        
-        if result['success']:
-            print_success("All tests completed successfully")
+        if run_pytest_with_coverage(suites):
+            print_success(f"{label} tests completed successfully")
             
             # Generar reportes
-            print_info("Generating coverage reports...")
-            
-            # Reporte de terminal
-            term_result = run_command(["python", "-m", "coverage", "report", "--show-missing"])
-            if term_result['success']:
-                print_success("Terminal report generated")
-                if term_result['stdout']:
-                    print("\nCoverage Summary:")
-                    print(term_result['stdout'])
-            
-            # Reporte HTML
-            html_result = run_command(["python", "-m", "coverage", "html", "--directory=htmlcov"])
-            if html_result['success']:
-                print_success("HTML report generated")
-                print_info("HTML report available at: htmlcov/index.html")
-            
-            # Reporte XML
-            xml_result = run_command(["python", "-m", "coverage", "xml", "-o", "coverage.xml"])
-            if xml_result['success']:
-                print_success("XML report generated")
-                print_info("XML report available at: coverage.xml")
+            print_info(f"Generating {label} coverage reports...")
+            generate_coverage_reports(f"{label} Coverage", html_dir, xml=xml)
             
             return True
         else:
-            print_error("Tests failed")
-            if result['stdout']:
-                print("STDOUT:")
-                print(result['stdout'])
-            if result['stderr']:
-                print("STDERR:")
-                print(result['stderr'])
+            print_error(f"{label} tests failed")
             return False
     else:
-        print_warning("Coverage module not available, running tests without coverage...")
+        print_warning("Coverage or pytest-cov not available, running tests without coverage...")
         
         # Ejecutar tests sin coverage
-        cmd = [
-            "python", "-m", "pytest",
-            "cli/tests",
-            "core/tests"
-        ]
+        cmd = ["python", "-m", "pytest"] + [test_path for test_path, _ in suites] + XDIST_ARGS
         
         result = run_command(cmd)
         
         if result['success']:
-            print_success("All tests completed successfully (without coverage)")
-            print_info("To enable coverage, install it with: pip install coverage")
+            print_success(f"{label} tests completed successfully (without coverage)")
+            print_info("To enable coverage, install it with: pip install coverage pytest-cov")
             return True
         else:
-            print_error("Tests failed")
+            print_error(f"{label} tests failed")
             if result['stdout']:
                 print("STDOUT:")
                 print(result['stdout'])
@@ -306,27 +256,21 @@ def main():
     print_header("Neural - Working Coverage Analysis")
     
     # Verificar que estamos en el directorio correcto
-    if not Path("cli").exists() or not Path("core").exists():
+    if not _HAS_CLI or not _HAS_CORE:
         print_error("This script must be run from the project root directory")
         sys.exit(1)
     
     start_time = time.time()
     
-    # Verificar argumentos
-    if len(sys.argv) > 1:
-        target = sys.argv[1].lower()
-        
-        if target == "cli":
-            success = run_tests_with_coverage_cli()
-        elif target == "core":
-            success = run_tests_with_coverage_core()
-        else:
-            print_error(f"Unknown target: {target}")
-            print_info("Available targets: cli, core, all (default)")
-            sys.exit(1)
-    else:
-        # Coverage completo por defecto
-        success = run_tests_with_coverage_all()
+    # Verificar argumentos (coverage completo por defecto)
+    target = sys.argv[1].lower() if len(sys.argv) > 1 else "all"
+    
+    if target not in COVERAGE_TARGETS:
+        print_error(f"Unknown target: {target}")
+        print_info("Available targets: cli, core, all (default)")
+        sys.exit(1)
+    
+    success = run_tests_with_coverage(*COVERAGE_TARGETS[target])
     
     # Resumen final
     end_time = time.time()
@@ -0,0 +1,108 @@
+"""Shared fixtures for the integration core tests."""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the repository root and the integration root to the path, so both the
+# integration package and its core package can be imported
+_ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, _ROOT)
+sys.path.insert(0, os.path.join(_ROOT, "custom_components", "neural"))
+
+from core.use_cases.implementations.ha_use_case_impl import HAUseCaseImpl
+from core.use_cases.implementations.do_actions_use_case_impl import DoActionsUseCaseImpl
+from core.use_cases.implementations.audio_use_case_impl import AudioUseCaseImpl
+
+
+class StubHARepository:
+    """HA repository stub that serves fixed entities and services, counts fetches and records service calls."""
+
+    def __init__(self, entity_ids, services):
+        self.entity_ids = list(entity_ids)
+        self.services = services
+        self.failing_entities = set()
+        self.entity_fetches = 0
+        self.service_fetches = 0
+        self.calls = []
+
+    async def get_all_entities(self):
+        self.entity_fetches += 1
+        return [SimpleNamespace(entity_id=entity_id) for entity_id in self.entity_ids]
+
+    async def get_services(self):
+        self.service_fetches += 1
+        return self.services
+
+    async def call_service(self, domain, service, entity_id, service_data):
+        self.calls.append((domain, service, entity_id, service_data))
+        if entity_id in self.failing_entities:
+            raise Exception(f"Service call failed for {entity_id}")
+        return {"entity_id": entity_id}
+
+
+class StubAudioRepository:
+    """Audio repository stub that transcribes each clip to its decoded text and records calls."""
+
+    def __init__(self):
+        self.error = None
+        self.supported = True
+        self.languages = ["es", "en"]
+        self.batches = []
+        self.probes = []
+
+    async def transcribe_audio_batch(self, audio_batch, language):
+        self.batches.append((list(audio_batch), language))
+        if self.error:
+            raise self.error
+        return [audio.decode() for audio in audio_batch]
+
+    async def is_audio_supported(self):
+        self.probes.append("supported")
+        return self.supported
+
+    async def get_supported_languages(self):
+        self.probes.append("languages")
+        return self.languages
+
+    async def test_audio_connection(self):
+        self.probes.append("connection")
+        return self.supported
+
+
+@pytest.fixture
+def ha_repository():
+    """HA repository with two lights and a switch, and their services."""
+    return StubHARepository(
+        ["light.salon", "light.cocina", "switch.riego"],
+        [
+            {"domain": "light", "services": {"turn_on": {}, "turn_off": {}}},
+            {"domain": "switch", "services": {"toggle": {}}},
+        ],
+    )
+
+
+@pytest.fixture
+def ha_use_case(ha_repository):
+    """HA use case over the stub repository."""
+    return HAUseCaseImpl(ha_repository)
+
+
+@pytest.fixture
+def do_actions(ha_repository, ha_use_case):
+    """Do actions use case sharing the HA use case snapshot."""
+    return DoActionsUseCaseImpl(ha_repository, ha_use_case)
+
+
+@pytest.fixture
+def audio_repository():
+    """Audio repository that transcribes clips to their decoded text."""
+    return StubAudioRepository()
+
+
+@pytest.fixture
+def audio_use_case(audio_repository):
+    """Audio use case over the stub repository."""
+    return AudioUseCaseImpl(audio_repository)
@@ -0,0 +1,95 @@
+"""Tests for the audio use case."""
+
+import pytest
+
+from core.use_cases.implementations import audio_use_case_impl
+
+
+class TestTranscribeAudioBatch:
+    """Tests for AudioUseCaseImpl.transcribe_audio_batch."""
+
+    async def test_transcriptions_follow_clip_order(self, audio_repository, audio_use_case):
+        """Test that clips of any length are passed and returned in caller order."""
+        batch = [b"una frase bastante larga", b"corta", b"mediana"]
+
+        transcriptions = await audio_use_case.transcribe_audio_batch(batch, "es")
+
+        assert transcriptions == ["una frase bastante larga", "corta", "mediana"]
+        assert audio_repository.batches == [(batch, "es")]
+
+    async def test_empty_batch_skips_repository(self, audio_repository, audio_use_case):
+        """Test that an empty batch does not call the repository."""
+        assert await audio_use_case.transcribe_audio_batch([]) == []
+        assert audio_repository.batches == []
+
+    async def test_single_clip_uses_batch_call(self, audio_repository, audio_use_case):
+        """Test that transcribe_audio returns the transcription of its clip."""
+        assert await audio_use_case.transcribe_audio(b"hola", "en") == "hola"
+        assert audio_repository.batches == [([b"hola"], "en")]
+
+    async def test_repository_errors_propagate(self, audio_repository, audio_use_case):
+        """Test that repository failures reach the caller."""
+        audio_repository.error = RuntimeError("backend down")
+
+        with pytest.raises(RuntimeError, match="backend down"):
+            await audio_use_case.transcribe_audio_batch([b"hola"])
+
+
+class TestAudioProbes:
+    """Tests for the memoized audio support and language probes."""
+
+    async def test_supported_result_is_cached(self, audio_repository, audio_use_case):
+        """Test that positive support is asked only once within the TTL."""
+        assert await audio_use_case.is_audio_supported()
+        assert await audio_use_case.is_audio_supported()
+
+        assert audio_repository.probes == ["supported"]
+
+    async def test_unsupported_result_is_asked_again(self, audio_repository, audio_use_case):
+        """Test that a failed probe does not disable audio until restart."""
+        audio_repository.supported = False
+        assert not await audio_use_case.is_audio_supported()
+
+        audio_repository.supported = True
+
+        assert await audio_use_case.is_audio_supported()
+        assert audio_repository.probes == ["supported", "supported"]
+
+    async def test_probes_expire_after_ttl(self, audio_repository, audio_use_case, monkeypatch):
+        """Test that cached probes are asked again once the TTL passes."""
+        monkeypatch.setattr(audio_use_case_impl, "PROBE_TTL", 0)
+
+        await audio_use_case.is_audio_supported()
+        await audio_use_case.is_audio_supported()
+        await audio_use_case.get_supported_languages()
+        await audio_use_case.get_supported_languages()
+
+        assert audio_repository.probes == ["supported", "supported", "languages", "languages"]
+
+    async def test_languages_are_returned_as_copies(self, audio_repository, audio_use_case):
+        """Test that callers cannot mutate the cached language list."""
+        (await audio_use_case.get_supported_languages()).append("fr")
+        (await audio_use_case.get_supported_languages()).append("de")
+
+        assert await audio_use_case.get_supported_languages() == ["es", "en"]
+        assert audio_repository.probes == ["languages"]
+
+    async def test_connection_test_is_never_cached(self, audio_repository, audio_use_case):
+        """Test that every connection test reaches the repository."""
+        assert await audio_use_case.test_audio_connection()
+
+        audio_repository.supported = False
+
+        assert not await audio_use_case.test_audio_connection()
+        assert audio_repository.probes == ["connection", "connection"]
+
+    async def test_invalidate_cache_forgets_probes(self, audio_repository, audio_use_case):
+        """Test that invalidating the cache makes the next probes reach the repository."""
+        await audio_use_case.is_audio_supported()
+        await audio_use_case.get_supported_languages()
+
+        audio_use_case.invalidate_cache()
+        await audio_use_case.is_audio_supported()
+        await audio_use_case.get_supported_languages()
+
+        assert audio_repository.probes == ["supported", "languages", "supported", "languages"]
@@ -0,0 +1,93 @@
+"""Tests for executing decision actions."""
+
+import pytest
+
+from core.use_cases.interfaces.decision_use_case import DecisionAction
+
+
+class TestExecuteActions:
+    """Tests for DoActionsUseCaseImpl.execute_actions."""
+
+    async def test_empty_actions_raise_value_error(self, do_actions):
+        """Test that an empty action list is rejected."""
+        with pytest.raises(ValueError):
+            await do_actions.execute_actions([])
+
+    async def test_all_actions_succeed(self, ha_repository, do_actions):
+        """Test that valid actions are executed with their parameters."""
+        response = await do_actions.execute_actions([
+            DecisionAction("light.salon", "turn_on", {"brightness": 200}),
+            DecisionAction("switch.riego", "toggle"),
+        ])
+
+        assert response.total_actions == 2
+        assert response.successful_actions == 2
+        assert response.failed_actions == 0
+        assert response.success_rate == 100.0
+        assert ha_repository.calls == [
+            ("light", "turn_on", "light.salon", {"brightness": 200}),
+            ("switch", "toggle", "switch.riego", {}),
+        ]
+
+    async def test_partial_success_keeps_result_order(self, ha_repository, do_actions):
+        """Test that failures are counted and every slot holds its action's result."""
+        ha_repository.failing_entities.add("light.cocina")
+        actions = [
+            DecisionAction("light.salon", "turn_on"),
+            DecisionAction("light.garaje", "turn_on"),
+            DecisionAction("light.cocina", "turn_off"),
+            DecisionAction("switch.riego", "toggle"),
+        ]
+
+        response = await do_actions.execute_actions(actions)
+
+        assert [result.entity for result in response.results] == [action.entity for action in actions]
+        assert [result.success for result in response.results] == [True, False, False, True]
+        assert response.successful_actions == 2
+        assert response.failed_actions == 2
+        assert response.success_rate == 50.0
+        assert response.message == "Executed 4 actions: 2 successful, 2 failed"
+
+    async def test_malformed_action_fails_alone(self, ha_repository, do_actions):
+        """Test that an action with non-string fields fails without aborting the batch."""
+        response = await do_actions.execute_actions([
+            DecisionAction(["light.salon"], "turn_on"),
+            DecisionAction("light.salon", None),
+            DecisionAction("switch.riego", "toggle"),
+        ])
+
+        assert [result.success for result in response.results] == [False, False, True]
+        assert response.results[0].error_message == "Action validation failed"
+        assert ha_repository.calls == [("switch", "toggle", "switch.riego", {})]
+
+    async def test_invalid_actions_are_not_executed(self, ha_repository, do_actions):
+        """Test that actions failing validation never reach the repository."""
+        response = await do_actions.execute_actions([
+            DecisionAction("light.garaje", "turn_on"),
+            DecisionAction("light.salon", "dim"),
+            DecisionAction("salon", "turn_on"),
+        ])
+
+        assert ha_repository.calls == []
+        assert response.success_rate == 0.0
+        assert all(
+            result.error_message == "Action validation failed" for result in response.results
+        )
+
+    async def test_service_error_is_reported_in_result(self, ha_repository, do_actions):
+        """Test that a failing service call becomes a failed result."""
+        ha_repository.failing_entities.add("light.salon")
+
+        response = await do_actions.execute_actions([DecisionAction("light.salon", "turn_on")])
+
+        assert response.failed_actions == 1
+        assert response.results[0].error_message == "Service call failed for light.salon"
+
+
+class TestExecuteSingleAction:
+    """Tests for DoActionsUseCaseImpl.execute_single_action."""
+
+    async def test_non_string_entity_raises_value_error(self, do_actions):
+        """Test that a malformed entity is reported as invalid input."""
+        with pytest.raises(ValueError):
+            await do_actions.execute_single_action(DecisionAction(["light.salon"], "turn_on"))
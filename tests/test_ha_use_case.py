@@ -0,0 +1,126 @@
+"""Tests for the Home Assistant entity snapshot."""
+
+import asyncio
+
+from core.use_cases.implementations import ha_use_case_impl
+from core.use_cases.interfaces.decision_use_case import DecisionAction
+
+
+class TestEntitySnapshot:
+    """Tests for HAUseCaseImpl.get_entity_snapshot."""
+
+    async def test_snapshot_indexes_entities_and_services(self, ha_use_case):
+        """Test that the snapshot holds entity ids and services by domain."""
+        snapshot = await ha_use_case.get_entity_snapshot()
+
+        assert snapshot.entity_ids == frozenset({"light.salon", "light.cocina", "switch.riego"})
+        assert set(snapshot.services["light"]) == {"turn_on", "turn_off"}
+
+    async def test_snapshot_is_shared_within_ttl(self, ha_repository, ha_use_case):
+        """Test that repeated calls reuse a single fetch."""
+        first = await ha_use_case.get_entity_snapshot()
+        second = await ha_use_case.get_entity_snapshot()
+
+        assert first is second
+        assert ha_repository.entity_fetches == 1
+        assert ha_repository.service_fetches == 1
+
+    async def test_snapshot_is_refetched_after_ttl(self, ha_repository, ha_use_case, monkeypatch):
+        """Test that an expired snapshot is fetched again."""
+        monkeypatch.setattr(ha_use_case_impl, "SNAPSHOT_TTL", 0)
+
+        await ha_use_case.get_entity_snapshot()
+        await ha_use_case.get_entity_snapshot()
+
+        assert ha_repository.entity_fetches == 2
+
+    async def test_concurrent_callers_share_one_fetch(self, ha_repository, ha_use_case):
+        """Test that callers arriving during a refresh reuse its snapshot."""
+        snapshots = await asyncio.gather(*(ha_use_case.get_entity_snapshot() for _ in range(3)))
+
+        assert snapshots[0] is snapshots[1] is snapshots[2]
+        assert ha_repository.entity_fetches == 1
+
+
+class TestValidateActionSnapshot:
+    """Tests for action validation against the entity snapshot."""
+
+    async def test_known_action_does_not_refresh(self, ha_repository, do_actions):
+        """Test that a hit is served from the cached snapshot."""
+        assert await do_actions.validate_action(DecisionAction("light.salon", "turn_on"))
+        assert await do_actions.validate_action(DecisionAction("light.salon", "turn_off"))
+        assert ha_repository.entity_fetches == 1
+        assert ha_repository.service_fetches == 1
+
+    async def test_unknown_service_is_rejected(self, do_actions):
+        """Test that a service missing from the entity domain is rejected."""
+        assert not await do_actions.validate_action(DecisionAction("light.salon", "toggle"))
+
+    async def test_entity_added_after_snapshot_is_accepted(self, ha_repository, ha_use_case, do_actions):
+        """Test that a miss refreshes the snapshot once before rejecting."""
+        await ha_use_case.get_entity_snapshot()
+
+        ha_repository.entity_ids.append("light.garaje")
+
+        assert await do_actions.validate_action(DecisionAction("light.garaje", "turn_on"))
+        assert ha_repository.entity_fetches == 2
+
+    async def test_unknown_entity_is_rejected_after_one_refresh(self, ha_repository, do_actions):
+        """Test that an entity missing from the fresh snapshot is rejected."""
+        assert not await do_actions.validate_action(DecisionAction("light.garaje", "turn_on"))
+        assert ha_repository.entity_fetches == 2
+
+    async def test_batch_refreshes_at_most_once(self, ha_repository, do_actions):
+        """Test that several unknown entities in one batch share a single refresh."""
+        response = await do_actions.execute_actions([
+            DecisionAction("light.garaje", "turn_on"),
+            DecisionAction("light.salon", "turn_on"),
+            DecisionAction("light.atico", "turn_on"),
+        ])
+
+        assert [result.success for result in response.results] == [False, True, False]
+        assert ha_repository.entity_fetches == 2
+
+    async def test_concurrent_misses_share_one_refresh(self, ha_repository, ha_use_case, do_actions):
+        """Test that concurrent validations missing the snapshot refresh it together."""
+        await ha_use_case.get_entity_snapshot()
+
+        validations = await asyncio.gather(
+            do_actions.validate_action(DecisionAction("light.garaje", "turn_on")),
+            do_actions.validate_action(DecisionAction("light.atico", "turn_on")),
+        )
+
+        assert validations == [False, False]
+        assert ha_repository.entity_fetches == 2
+
+
+class TestGetBulk:
+    """Tests for HAUseCaseImpl.get_bulk."""
+
+    async def test_only_requested_parts_are_fetched(self, ha_repository, ha_use_case):
+        """Test that the result holds exactly the requested parts."""
+        bulk = await ha_use_case.get_bulk(entities=True, services=True, config=False)
+
+        assert set(bulk) == {"entities", "services"}
+        assert [entity.entity_id for entity in bulk["entities"]] == ha_repository.entity_ids
+        assert bulk["services"] is ha_repository.services
+
+    async def test_parts_are_fetched_concurrently(self, ha_repository, ha_use_case, monkeypatch):
+        """Test that a getter waiting on a later one does not block it."""
+        services_started = asyncio.Event()
+        get_services = ha_repository.get_services
+
+        async def get_all_entities():
+            await services_started.wait()
+            return []
+
+        async def get_services_and_signal():
+            services_started.set()
+            return await get_services()
+
+        monkeypatch.setattr(ha_repository, "get_all_entities", get_all_entities)
+        monkeypatch.setattr(ha_repository, "get_services", get_services_and_signal)
+
+        bulk = await asyncio.wait_for(ha_use_case.get_bulk(config=False), 1)
+
+        assert bulk == {"entities": [], "services": ha_repository.services}
@@ -0,0 +1,57 @@
+"""Tests for the Assist intent handler."""
+
+import logging
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.neural.intent import NeuralIntentHandler, _ERROR_SPEECH
+
+
+class StubCoordinator:
+    """Coordinator stub that answers commands or fails like the AI client."""
+
+    def __init__(self, response=None, error=None):
+        self.response = response
+        self.error = error
+        self.commands = []
+
+    async def process_command(self, command):
+        self.commands.append(command)
+        if self.error:
+            raise self.error
+        return self.response
+
+
+def make_intent(text):
+    """Create an intent whose response records the speech it is given."""
+    intent_obj = Mock(text=text)
+    intent_obj.create_response.return_value = Mock()
+    return intent_obj
+
+
+class TestNeuralIntentHandler:
+    """Tests for NeuralIntentHandler.async_handle."""
+
+    async def test_response_is_spoken(self):
+        """Test that the coordinator answer becomes the intent speech."""
+        coordinator = StubCoordinator(response="Luz encendida")
+        intent_obj = make_intent("enciende la luz")
+
+        response = await NeuralIntentHandler(coordinator).async_handle(intent_obj)
+
+        assert coordinator.commands == ["enciende la luz"]
+        response.async_set_speech.assert_called_once_with("Luz encendida")
+
+    async def test_client_error_returns_error_speech(self, caplog):
+        """Test that a bare Exception from the AI client still yields a spoken answer."""
+        coordinator = StubCoordinator(error=Exception("Invalid API key"))
+        intent_obj = make_intent("enciende la luz")
+        caplog.set_level(logging.INFO, logger="custom_components.neural.intent")
+
+        response = await NeuralIntentHandler(coordinator).async_handle(intent_obj)
+
+        assert response is intent_obj.create_response.return_value
+        response.async_set_speech.assert_called_once_with(_ERROR_SPEECH)
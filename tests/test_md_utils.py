@@ -0,0 +1,115 @@
+"""Tests for the markdown template caches."""
+
+import os
+
+import pytest
+
+from core.utils import md_utils
+
+
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    """Point the CLI prompts directory at an empty temporary directory."""
+    monkeypatch.setattr(md_utils, "_CLI_PROMPTS_DIR", tmp_path)
+    monkeypatch.setattr(md_utils, "_TEMPLATE_CACHE", {})
+    monkeypatch.setattr(md_utils, "_TEMPLATES_CACHE", {})
+    monkeypatch.setattr(md_utils, "_PRELOADED", {})
+    md_utils.get_template_path.cache_clear()
+    yield tmp_path
+    md_utils.get_template_path.cache_clear()
+
+
+def rewrite_keeping_mtime(path, content):
+    """Replace a file's content without changing its modification time."""
+    stat = os.stat(path)
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def touch_later(path):
+    """Move a file's modification time forward."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestReadTemplate:
+    """Tests for read_md_template."""
+
+    def test_unchanged_template_is_served_from_cache(self, prompts_dir):
+        """Test that a template with the same mtime is not read again."""
+        template = prompts_dir / "prompt.md"
+        template.write_text("first", encoding="utf-8")
+        assert md_utils.read_md_template("prompt.md") == "first"
+
+        rewrite_keeping_mtime(template, "second")
+
+        assert md_utils.read_md_template("prompt.md") == "first"
+
+    def test_modified_template_is_read_again(self, prompts_dir):
+        """Test that a newer mtime invalidates the cached content."""
+        template = prompts_dir / "prompt.md"
+        template.write_text("first", encoding="utf-8")
+        md_utils.read_md_template("prompt.md")
+
+        rewrite_keeping_mtime(template, "second")
+        touch_later(template)
+
+        assert md_utils.read_md_template("prompt.md") == "second"
+
+    def test_cache_evicts_least_recently_used(self, prompts_dir, monkeypatch):
+        """Test that the cache keeps at most its size, dropping the oldest entry."""
+        monkeypatch.setattr(md_utils, "_TEMPLATE_CACHE_SIZE", 2)
+        for name in ("a.md", "b.md", "c.md"):
+            (prompts_dir / name).write_text(name, encoding="utf-8")
+
+        md_utils.read_md_template("a.md")
+        md_utils.read_md_template("b.md")
+        md_utils.read_md_template("a.md")
+        md_utils.read_md_template("c.md")
+
+        assert set(md_utils._TEMPLATE_CACHE) == {("a.md", False), ("c.md", False)}
+
+    def test_missing_template_raises(self, prompts_dir):
+        """Test that a missing template raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            md_utils.read_md_template("missing.md")
+
+    def test_preloaded_template_skips_filesystem(self, prompts_dir):
+        """Test that preloaded templates survive the file being removed."""
+        (prompts_dir / "prompt.md").write_text("preloaded", encoding="utf-8")
+
+        assert md_utils.preload_templates() == {"prompt.md": "preloaded"}
+        (prompts_dir / "prompt.md").unlink()
+
+        assert md_utils.read_md_template("prompt.md") == "preloaded"
+
+
+class TestListTemplates:
+    """Tests for list_available_templates."""
+
+    def test_listing_only_includes_markdown(self, prompts_dir):
+        """Test that only .md files are listed."""
+        (prompts_dir / "prompt.md").write_text("", encoding="utf-8")
+        (prompts_dir / "notes.txt").write_text("", encoding="utf-8")
+
+        assert md_utils.list_available_templates() == ["prompt.md"]
+
+    def test_listing_is_cached_until_directory_changes(self, prompts_dir):
+        """Test that the listing is reused while the directory mtime holds."""
+        (prompts_dir / "a.md").write_text("", encoding="utf-8")
+        md_utils.list_available_templates()
+        stat = os.stat(prompts_dir)
+
+        (prompts_dir / "b.md").write_text("", encoding="utf-8")
+        os.utime(prompts_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert md_utils.list_available_templates() == ["a.md"]
+
+        touch_later(prompts_dir)
+        assert sorted(md_utils.list_available_templates()) == ["a.md", "b.md"]
+        assert len(md_utils._TEMPLATES_CACHE) == 1
+
+    def test_missing_directory_lists_nothing(self, prompts_dir, monkeypatch):
+        """Test that a missing prompts directory yields an empty list."""
+        monkeypatch.setattr(md_utils, "_CLI_PROMPTS_DIR", prompts_dir / "missing")
+
+        assert md_utils.list_available_templates() == []
@@ -0,0 +1,80 @@
+"""Tests for the Neural AI services."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.neural.const import SERVICE_SEND_MESSAGE, SERVICE_UPDATE_CONFIG
+from custom_components.neural.services import async_setup_services
+
+
+class StubCoordinator:
+    """Coordinator stub that answers commands or fails like the AI client."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.entry = SimpleNamespace(entry_id="entry", data={"ai_model": "a", "personality": "b"})
+        self.last_response = None
+        self.last_command = None
+
+    async def process_command(self, command):
+        if self.error:
+            raise self.error
+        return f"ok: {command}"
+
+
+@pytest.fixture
+def hass():
+    """Home Assistant stub that keeps the registered service handlers."""
+    handlers = {}
+    hass = Mock()
+    hass.data = {}
+    hass.services.async_register.side_effect = (
+        lambda domain, service, handler, schema=None: handlers.__setitem__(service, handler)
+    )
+    hass.handlers = handlers
+    return hass
+
+
+class TestServices:
+    """Tests for the services bound to a coordinator."""
+
+    async def test_send_message_uses_bound_coordinator(self, hass):
+        """Test that the handler answers through the coordinator given at setup."""
+        coordinator = StubCoordinator()
+        await async_setup_services(hass, coordinator)
+
+        await hass.handlers[SERVICE_SEND_MESSAGE](SimpleNamespace(data={"message": "hola"}))
+
+        assert coordinator.last_command == "hola"
+        assert coordinator.last_response == "ok: hola"
+
+    async def test_send_message_survives_client_errors(self, hass):
+        """Test that a bare Exception from the AI client is logged, not raised."""
+        coordinator = StubCoordinator(error=Exception("Invalid API key"))
+        await async_setup_services(hass, coordinator)
+
+        await hass.handlers[SERVICE_SEND_MESSAGE](SimpleNamespace(data={"message": "hola"}))
+
+        assert coordinator.last_response is None
+
+    async def test_update_config_merges_entry_data(self, hass):
+        """Test that new settings replace the entry data through the entries manager."""
+        coordinator = StubCoordinator()
+        await async_setup_services(hass, coordinator)
+
+        await hass.handlers[SERVICE_UPDATE_CONFIG](SimpleNamespace(data={"config": {"personality": "c"}}))
+
+        hass.config_entries.async_update_entry.assert_called_once_with(
+            coordinator.entry, data={"ai_model": "a", "personality": "c"}
+        )
+
+    async def test_update_config_survives_errors(self, hass):
+        """Test that a rejected update is logged, not raised."""
+        await async_setup_services(hass, StubCoordinator())
+        hass.config_entries.async_update_entry.side_effect = ValueError("invalid entry")
+
+        await hass.handlers[SERVICE_UPDATE_CONFIG](SimpleNamespace(data={"config": {"personality": "c"}}))
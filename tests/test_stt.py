@@ -0,0 +1,76 @@
+"""Tests for the speech-to-text entity."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.neural import stt
+
+
+class StubAudioUseCase:
+    """Audio use case stub that joins streamed chunks into their decoded text."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.streams = 0
+
+    async def transcribe_audio_stream(self, chunks, language):
+        self.streams += 1
+        audio = b"".join([chunk async for chunk in chunks])
+        await asyncio.sleep(self.delay)
+        return audio.decode()
+
+    def invalidate_cache(self):
+        pass
+
+
+async def audio_stream(*chunks):
+    """Yield audio chunks like the Assist pipeline does."""
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+@pytest.fixture
+def make_entity(monkeypatch):
+    """Build an STT entity around a stub audio use case, without a real session."""
+    monkeypatch.setattr(stt, "async_get_clientsession", lambda hass: None)
+
+    def _make_entity(audio_use_case, timeout=1.0):
+        entity = stt.NeuralSTTEntity(None, {}, "entry")
+        entity._audio_use_case = audio_use_case
+        entity._timeout = timeout
+        return entity
+
+    return _make_entity
+
+
+class TestTranscribe:
+    """Tests for NeuralSTTEntity._transcribe."""
+
+    async def test_stream_is_transcribed(self, make_entity):
+        """Test that streamed chunks reach the use case as one utterance."""
+        entity = make_entity(StubAudioUseCase())
+
+        assert await entity._transcribe(audio_stream(b"enciende ", b"la luz"), "es") == "enciende la luz"
+
+    async def test_concurrent_utterances_are_streamed(self, make_entity):
+        """Test that concurrent utterances all take the streaming path."""
+        audio_use_case = StubAudioUseCase(delay=0.01)
+        entity = make_entity(audio_use_case)
+
+        texts = await asyncio.gather(
+            entity._transcribe(audio_stream(b"uno"), "es"),
+            entity._transcribe(audio_stream(b"dos"), "es"),
+        )
+
+        assert texts == ["uno", "dos"]
+        assert audio_use_case.streams == 2
+
+    async def test_slow_backend_times_out_after_audio_ends(self, make_entity):
+        """Test that a backend slower than the timeout yields an empty result."""
+        entity = make_entity(StubAudioUseCase(delay=1.0), timeout=0.01)
+
+        assert await entity._transcribe(audio_stream(b"hola"), "es") == ""
@@ -0,0 +1,133 @@
+"""Tests for storing the home information file."""
+
+import asyncio
+import os
+
+import pytest
+
+from core.use_cases.implementations import update_home_info_use_case_impl
+from core.use_cases.implementations.update_home_info_use_case_impl import UpdateHomeInfoUseCaseImpl
+
+HOME_INFO = "# Casa\n\nSalón con dos luces y un riego."
+
+
+@pytest.fixture
+def home_dir(tmp_path, monkeypatch):
+    """Run each test from an empty directory, where home_info.md is stored."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+class TestUpdateHomeInfo:
+    """Tests for UpdateHomeInfoUseCaseImpl.update_home_info."""
+
+    async def test_update_writes_stripped_content(self, home_dir):
+        """Test that the stripped content replaces the file without leftovers."""
+        use_case = UpdateHomeInfoUseCaseImpl()
+
+        assert await use_case.update_home_info(f"  {HOME_INFO}\n\n")
+
+        assert (home_dir / "home_info.md").read_text(encoding="utf-8") == HOME_INFO
+        assert os.listdir(home_dir) == ["home_info.md"]
+
+    @pytest.mark.parametrize("home_info", ["", "   \n  ", "corto", "   corto   "])
+    async def test_invalid_content_is_rejected(self, home_dir, home_info):
+        """Test that empty or short content is rejected without writing."""
+        with pytest.raises(OSError, match="Home information"):
+            await UpdateHomeInfoUseCaseImpl().update_home_info(home_info)
+
+        assert os.listdir(home_dir) == []
+
+    async def test_concurrent_updates_do_not_collide(self, home_dir):
+        """Test that concurrent writers each use their own temporary file."""
+        contents = [f"{HOME_INFO} Versión {index}." for index in range(8)]
+
+        await asyncio.gather(*(UpdateHomeInfoUseCaseImpl().update_home_info(content) for content in contents))
+
+        assert (home_dir / "home_info.md").read_text(encoding="utf-8") in contents
+        assert os.listdir(home_dir) == ["home_info.md"]
+
+    async def test_failed_write_removes_temporary_file(self, home_dir, monkeypatch):
+        """Test that a failed replace leaves neither the target nor a temporary file."""
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(update_home_info_use_case_impl.os, "replace", fail_replace)
+
+        with pytest.raises(OSError, match="disk full"):
+            await UpdateHomeInfoUseCaseImpl().update_home_info(HOME_INFO)
+
+        assert os.listdir(home_dir) == []
+
+
+def rewrite(path, content, mtime_ns):
+    """Replace a file's content and set its modification time."""
+    path.write_text(content, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestGetHomeInfo:
+    """Tests for the cached UpdateHomeInfoUseCaseImpl.get_home_info."""
+
+    async def test_missing_file_returns_none(self, home_dir):
+        """Test that no file means no home information."""
+        assert await UpdateHomeInfoUseCaseImpl().get_home_info() is None
+
+    async def test_unchanged_file_is_served_from_cache(self, home_dir):
+        """Test that a file with the same mtime and size is not read again."""
+        path = home_dir / "home_info.md"
+        path.write_text(HOME_INFO, encoding="utf-8")
+        use_case = UpdateHomeInfoUseCaseImpl()
+        assert await use_case.get_home_info() == HOME_INFO
+
+        rewrite(path, HOME_INFO.upper(), os.stat(path).st_mtime_ns)
+
+        assert await use_case.get_home_info() == HOME_INFO
+
+    async def test_same_tick_edit_of_other_size_is_read(self, home_dir):
+        """Test that an edit keeping the mtime but changing the size is noticed."""
+        path = home_dir / "home_info.md"
+        path.write_text(HOME_INFO, encoding="utf-8")
+        use_case = UpdateHomeInfoUseCaseImpl()
+        await use_case.get_home_info()
+
+        rewrite(path, "Contenido reemplazado", os.stat(path).st_mtime_ns)
+
+        assert await use_case.get_home_info() == "Contenido reemplazado"
+
+    async def test_modified_file_is_read_again(self, home_dir):
+        """Test that a newer mtime invalidates the cached content."""
+        path = home_dir / "home_info.md"
+        path.write_text(HOME_INFO, encoding="utf-8")
+        use_case = UpdateHomeInfoUseCaseImpl()
+        await use_case.get_home_info()
+
+        rewrite(path, HOME_INFO.upper(), os.stat(path).st_mtime_ns + 1_000_000_000)
+
+        assert await use_case.get_home_info() == HOME_INFO.upper()
+
+    async def test_update_primes_the_cache(self, home_dir):
+        """Test that content written by the use case is read back from cache."""
+        use_case = UpdateHomeInfoUseCaseImpl()
+        await use_case.update_home_info(HOME_INFO)
+        path = home_dir / "home_info.md"
+
+        rewrite(path, HOME_INFO.upper(), os.stat(path).st_mtime_ns)
+
+        assert await use_case.get_home_info() == HOME_INFO
+
+    async def test_clear_removes_file_and_cache(self, home_dir):
+        """Test that clearing deletes the file and forgets the cached content."""
+        use_case = UpdateHomeInfoUseCaseImpl()
+        await use_case.update_home_info(HOME_INFO)
+
+        assert await use_case.clear_home_info()
+
+        assert not (home_dir / "home_info.md").exists()
+        assert await use_case.get_home_info() is None
+
+    async def test_empty_file_returns_none(self, home_dir):
+        """Test that an empty file means no home information."""
+        (home_dir / "home_info.md").write_text("", encoding="utf-8")
+
+        assert await UpdateHomeInfoUseCaseImpl().get_home_info() is None